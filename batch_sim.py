@@ -0,0 +1,178 @@
+"""
+Batch simulator for balance and throughput sweeps.
+Runs many headless games with the bot player across a process pool (one seed
+per game) and aggregates survival wave, damage taken, mana earned and
+per-frame cost into a JSON balance report.
+
+    python batch_sim.py --games 64 --difficulty normal --difficulty hard
+    python batch_sim.py --games 32 --set DIFFICULTY_SETTINGS.hard.enemy_hp_multiplier=1.2
+"""
+
+import os
+os.environ.setdefault('PVE_HEADLESS', '1')  # Must be set before config is imported
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import sys
+import ast
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import config
+from game import Game, GameState
+from bot import BotPlayer
+
+
+# Config tables that --set may override
+TUNABLE = ('DIFFICULTY_SETTINGS', 'ENEMY_TYPES')
+
+
+def apply_overrides(overrides):
+    """Apply {'TABLE.key.field': value} overrides to the config tables in this process"""
+    for path, value in overrides.items():
+        table, *keys = path.split('.')
+        if table not in TUNABLE or not keys:
+            raise ValueError(f'Cannot override {path}: use one of {", ".join(TUNABLE)}')
+        target = getattr(config, table)
+        for key in keys[:-1]:
+            target = target[key]
+        target[keys[-1]] = value
+
+
+def simulate(seed, difficulty='normal', max_frames=60 * 60 * 30, sim_rate=60):
+    """Play one bot game to the end (or max_frames) and return its stats"""
+    game = Game(headless=True, seed=seed)
+    game.profiler.enabled = False
+    game.start_new_game(difficulty)
+    bot = BotPlayer()
+    dt = 1.0 / sim_rate
+
+    frame_ms = []
+    perf_counter = time.perf_counter
+    while game.state == GameState.PLAYING and len(frame_ms) < max_frames:
+        inputs = bot(game)
+        start = perf_counter()
+        game.step(dt, inputs)
+        frame_ms.append((perf_counter() - start) * 1000.0)
+
+    frame_ms.sort()
+    result = {
+        GameState.VICTORY: 'victory',
+        GameState.GAME_OVER: 'game_over'
+    }.get(game.state, 'timeout')
+    return {
+        'seed': seed,
+        'difficulty': difficulty,
+        'result': result,
+        'wave': game.wave_manager.current_wave,
+        'damage_taken': game.player.damage_taken,
+        'mana_earned': game.player.mana_earned,
+        'frames': len(frame_ms),
+        'avg_frame_ms': sum(frame_ms) / len(frame_ms) if frame_ms else 0.0,
+        'p99_frame_ms': frame_ms[min(len(frame_ms) - 1, int(len(frame_ms) * 0.99))] if frame_ms else 0.0
+    }
+
+
+def _run_game(job):
+    seed, difficulty, max_frames = job
+    return simulate(seed, difficulty, max_frames)
+
+
+def _stats(values):
+    ordered = sorted(values)
+    return {
+        'mean': round(sum(ordered) / len(ordered), 3),
+        'median': ordered[len(ordered) // 2],
+        'min': ordered[0],
+        'max': ordered[-1]
+    }
+
+
+def aggregate(games):
+    """Summarize a list of simulate() results"""
+    total_frames = sum(game['frames'] for game in games)
+    return {
+        'games': len(games),
+        'win_rate': round(sum(game['result'] == 'victory' for game in games) / len(games), 3),
+        'timeouts': sum(game['result'] == 'timeout' for game in games),
+        'wave': _stats([game['wave'] for game in games]),
+        'damage_taken': _stats([game['damage_taken'] for game in games]),
+        'mana_earned': _stats([game['mana_earned'] for game in games]),
+        'avg_frame_ms': round(sum(game['avg_frame_ms'] * game['frames'] for game in games)
+                              / max(total_frames, 1), 4),
+        'p99_frame_ms': _stats([round(game['p99_frame_ms'], 4) for game in games]),
+        'frames': total_frames
+    }
+
+
+def run_batch(games=32, difficulties=('normal',), seed_start=0, workers=None,
+              max_frames=60 * 60 * 30, overrides=None):
+    """Fan games across a process pool and return the balance report"""
+    overrides = overrides or {}
+    apply_overrides(overrides)
+    jobs = [(seed_start + i, difficulty, max_frames)
+            for difficulty in difficulties for i in range(games)]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=apply_overrides,
+                             initargs=(overrides,)) as pool:
+        results = list(pool.map(_run_game, jobs))
+    wall_time = time.perf_counter() - start
+
+    total_frames = sum(result['frames'] for result in results)
+    return {
+        'workers': workers or os.cpu_count(),
+        'wall_time_s': round(wall_time, 2),
+        'frames_per_second': round(total_frames / wall_time, 1) if wall_time else 0.0,
+        'overrides': overrides,
+        'difficulties': {
+            difficulty: aggregate([r for r in results if r['difficulty'] == difficulty])
+            for difficulty in difficulties
+        },
+        'games': results
+    }
+
+
+def _parse_override(text):
+    path, sep, value = text.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError(f'expected KEY=VALUE, got {text!r}')
+    try:
+        value = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        pass  # Plain strings
+    return path, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PVE Arena batch simulator')
+    parser.add_argument('--games', type=int, default=32, help='games per difficulty')
+    parser.add_argument('--difficulty', action='append', choices=sorted(config.DIFFICULTY_SETTINGS),
+                        help='difficulty to simulate (repeatable, default: normal)')
+    parser.add_argument('--seed-start', type=int, default=0, help='seed of the first game')
+    parser.add_argument('--workers', type=int, help='worker processes (default: all cores)')
+    parser.add_argument('--max-frames', type=int, default=60 * 60 * 30,
+                        help='frames before a game counts as a timeout')
+    parser.add_argument('--set', action='append', default=[], type=_parse_override,
+                        metavar='TABLE.KEY.FIELD=VALUE',
+                        help='override a DIFFICULTY_SETTINGS or ENEMY_TYPES value (repeatable)')
+    parser.add_argument('--per-game', action='store_true', help='include every game in the report')
+    parser.add_argument('--output', metavar='PATH', help='write JSON here instead of stdout')
+    args = parser.parse_args()
+
+    report = run_batch(args.games, args.difficulty or ['normal'], args.seed_start,
+                       args.workers, args.max_frames, dict(args.set))
+    if not args.per_game:
+        del report['games']
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    sys.exit()
+
+
+if __name__ == '__main__':
+    main()
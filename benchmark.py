@@ -0,0 +1,221 @@
+"""
+Reproducible stress benchmarks.
+Builds Game state directly for fixed scenarios, runs them headless through
+Game.step with a seeded RNG and reports ms per simulated frame split into
+update, collision and draw, as JSON so runs on different branches can be
+compared.
+
+    python benchmark.py --frames 300 --output results.json
+"""
+
+import os
+os.environ.setdefault('PVE_HEADLESS', '1')  # Must be set before config is imported
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # Keep stdout pure JSON
+
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import numpy as np
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, SIM_RATE, WORLD_WIDTH, WORLD_HEIGHT, MANA_COLLECTION_RADIUS
+from game import Game
+from inputs import InputState
+from mana import ManaDrop
+from bullet import bullet_pool
+from savestate import load_state_file
+
+
+PHASES = ('update', 'collision', 'draw')
+
+# Profiler sections of Game._handle_collisions; the rest of a step counts as update
+COLLISION_SECTIONS = ('enemy_grid', 'bullet_enemy_collision', 'bullet_player_collision',
+                      'enemy_player_collision', 'mana_collection')
+
+
+def _random_point(rng, center, min_dist, max_dist):
+    """Random point in a ring around center, clamped to the world"""
+    angle = rng.uniform(0, 2 * math.pi)
+    dist = rng.uniform(min_dist, max_dist)
+    x = min(max(center.x + math.cos(angle) * dist, 0), WORLD_WIDTH)
+    y = min(max(center.y + math.sin(angle) * dist, 0), WORLD_HEIGHT)
+    return x, y
+
+
+# Scenarios: setup(game, rng) builds the initial state, refill(game, rng)
+# tops it up (untimed) before every frame, inputs is fed to the player.
+
+def _setup_shooters(game, rng):
+    for _ in range(500):
+        game._spawn_enemy('shooter', _random_point(rng, game.player.pos, 250, 1200))
+    for _ in range(1000):
+        x, y = rng.uniform(0, WORLD_WIDTH), rng.uniform(0, WORLD_HEIGHT)
+        bullet = bullet_pool.acquire(x, y, rng.uniform(0, 2 * math.pi), 4, 5, 'enemy')
+        game.enemy_bullets.add(bullet)
+        game.all_sprites.add(bullet)
+
+
+def _refill_burst(game, rng):
+    # Clear the previous burst's drops and debris so every frame is the same
+    for mana in game.mana_drops:
+        mana.kill()
+    game.particles.clear()
+    while len(game.enemies) < 100:
+        enemy = game._spawn_enemy(rng.choice(('shooter', 'bouncer', 'exploder', 'tank')),
+                                  _random_point(rng, game.player.pos, 30, 140))
+        enemy.hp = 1
+    game.player.mana = max(game.player.mana, 1000)
+    game.player.burst_cooldown = 0
+
+
+def _refill_particles(game, rng):
+    while len(game.particles) < 2000:
+        x, y = _random_point(rng, game.player.pos, 0, 400)
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        game.particles.emit(x, y, color, count=min(50, 2000 - len(game.particles)))
+
+
+def _refill_mana(game, rng):
+    while len(game.mana_drops) < 300:
+        x, y = _random_point(rng, game.player.pos, 25, MANA_COLLECTION_RADIUS)
+        mana = ManaDrop(x, y, amount=5)
+        mana.spawn_time = mana.spawn_duration  # Skip the drop animation
+        game._add_mana(mana)
+
+
+SCENARIOS = {
+    'shooters_500_bullets_1000': {'setup': _setup_shooters},
+    'burst_100_kills': {'refill': _refill_burst, 'inputs': InputState(burst=True)},
+    'particle_storm_2000': {'refill': _refill_particles},
+    'mana_magnet_300': {'refill': _refill_mana},
+}
+
+
+def _build_game(scenario, seed):
+    """Start a session frozen mid-wave with the scenario's state"""
+    game = Game(headless=True, seed=seed)
+    if 'state' in scenario:
+        # Checkpoint saved from a real session (see savestate.py)
+        load_state_file(game, scenario['state'])
+    else:
+        game.start_new_game('normal')
+        game.wave_manager.start_wave()
+    # Skip the transition and make the wave endless, so every frame is gameplay
+    game.wave_transition = False
+    game.wave_manager.enemies_remaining = 10 ** 9
+
+    # Keep the player alive however much damage the scenario deals
+    game.player.max_hp = game.player.hp = 10 ** 9
+    game.camera.follow(game.player, dt=10.0)  # Snap to the player
+
+    rng = random.Random(seed)
+    if 'setup' in scenario:
+        scenario['setup'](game, rng)
+    return game, rng
+
+
+def _summary(samples):
+    ordered = sorted(samples)
+    p99_index = min(len(ordered) - 1, int(len(ordered) * 0.99))
+    return {
+        'avg': round(sum(ordered) / len(ordered), 4),
+        'p99': round(ordered[p99_index], 4),
+        'max': round(ordered[-1], 4)
+    }
+
+
+def run_scenario(name, frames=300, warmup=30, seed=0):
+    """
+    Run one scenario and return its timings in ms per simulated frame.
+    name is a SCENARIOS key or 'state:<path>' for a save state file.
+    """
+    if name.startswith('state:'):
+        scenario = {'state': name[len('state:'):]}
+    else:
+        scenario = SCENARIOS[name]
+    game, rng = _build_game(scenario, seed)
+    refill = scenario.get('refill')
+    inputs = scenario.get('inputs', InputState())
+    dt = 1.0 / SIM_RATE
+
+    timings = {phase: [] for phase in PHASES + ('total',)}
+    counts = {'enemies': 0, 'player_bullets': 0, 'enemy_bullets': 0, 'mana_drops': 0, 'particles': 0}
+
+    for frame in range(warmup + frames):
+        if refill:
+            refill(game, rng)
+
+        # The same step the game runs, timed whole; collisions come from its profiler sections
+        start = time.perf_counter()
+        game.step(dt, inputs)
+        step_end = time.perf_counter()
+        game._interpolate(1.0)
+        game._draw_gameplay()
+        draw_end = time.perf_counter()
+
+        if frame < warmup:
+            continue
+        history = game.profiler.history
+        step_ms = (step_end - start) * 1000.0
+        collision_ms = sum(history[name][-1] for name in COLLISION_SECTIONS if name in history)
+        timings['update'].append(step_ms - collision_ms)
+        timings['collision'].append(collision_ms)
+        timings['draw'].append((draw_end - step_end) * 1000.0)
+        timings['total'].append((draw_end - start) * 1000.0)
+        counts['enemies'] += len(game.enemies)
+        counts['player_bullets'] += len(game.player_bullets)
+        counts['enemy_bullets'] += len(game.enemy_bullets)
+        counts['mana_drops'] += len(game.mana_drops)
+        counts['particles'] += len(game.particles)
+
+    result = {phase + '_ms': _summary(samples) for phase, samples in timings.items()}
+    result['avg_counts'] = {key: round(total / frames, 1) for key, total in counts.items()}
+    return result
+
+
+def run_benchmarks(names=None, frames=300, warmup=30, seed=0):
+    """Run the given scenarios (all by default) and return a JSON-ready dict"""
+    names = names or list(SCENARIOS)
+    return {
+        'seed': seed,
+        'frames': frames,
+        'warmup': warmup,
+        'sim_rate': SIM_RATE,
+        'screen': [SCREEN_WIDTH, SCREEN_HEIGHT],
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': np.__version__,
+        'scenarios': {name: run_scenario(name, frames, warmup, seed) for name in names}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PVE Arena stress benchmarks')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='scenario to run (repeatable, default: all)')
+    parser.add_argument('--state', action='append', default=[], metavar='PATH',
+                        help='also benchmark a save state file (repeatable)')
+    parser.add_argument('--frames', type=int, default=300, help='measured frames per scenario')
+    parser.add_argument('--warmup', type=int, default=30, help='unmeasured frames per scenario')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', metavar='PATH', help='write JSON here instead of stdout')
+    args = parser.parse_args()
+
+    names = (args.scenario or ([] if args.state else list(SCENARIOS)))
+    names += ['state:' + path for path in args.state]
+    results = run_benchmarks(names, args.frames, args.warmup, args.seed)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    pygame.quit()
+    sys.exit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Scripted bot player.
+Produces an InputState each step from the game state alone (no randomness),
+so a seeded headless session plays out the same way every time.
+"""
+
+import math
+from config import (WORLD_WIDTH, WORLD_HEIGHT, ABILITY_BURST_RADIUS,
+                    ABILITY_BURST_COST, ABILITY_SHIELD_COST, ABILITY_DASH_COST)
+from inputs import InputState
+
+
+class BotPlayer:
+    """Kites away from enemies and bullets, aims at the nearest enemy and spends mana"""
+
+    def __init__(self, danger_radius=300, bullet_radius=150, burst_min_targets=3):
+        self.danger_radius = danger_radius
+        self.bullet_radius = bullet_radius
+        self.burst_min_targets = burst_min_targets
+        self.upgrade_order = ('upgrade_damage', 'upgrade_hp', 'upgrade_speed')
+        self.next_upgrade = 0
+
+    def __call__(self, game):
+        return self.get_inputs(game)
+
+    def get_inputs(self, game):
+        player = game.player
+        px, py = player.pos
+        inputs = InputState(shoot=True)
+
+        # Push away from nearby enemies and enemy bullets, pull towards the centre
+        push_x = (WORLD_WIDTH / 2 - px) / WORLD_WIDTH
+        push_y = (WORLD_HEIGHT / 2 - py) / WORLD_HEIGHT
+        nearest = None
+        nearest_dist = math.inf
+        in_burst = 0
+        for enemy in game.enemies:
+            dx = px - enemy.pos.x
+            dy = py - enemy.pos.y
+            dist = math.hypot(dx, dy) or 1e-6
+            if dist < nearest_dist:
+                nearest, nearest_dist = enemy, dist
+            if dist < self.danger_radius:
+                weight = (self.danger_radius - dist) / self.danger_radius
+                push_x += dx / dist * weight
+                push_y += dy / dist * weight
+            if dist < ABILITY_BURST_RADIUS:
+                in_burst += 1
+
+        for bullet in game.enemy_bullets:
+            dx = px - bullet.pos.x
+            dy = py - bullet.pos.y
+            dist = math.hypot(dx, dy) or 1e-6
+            if dist < self.bullet_radius:
+                weight = (self.bullet_radius - dist) / self.bullet_radius
+                push_x += dx / dist * weight
+                push_y += dy / dist * weight
+
+        # Collect mana when nothing is close
+        if nearest_dist > self.danger_radius:
+            for mana in game.mana_drops:
+                dx = mana.pos.x - px
+                dy = mana.pos.y - py
+                dist = math.hypot(dx, dy) or 1e-6
+                push_x += dx / dist * 0.5
+                push_y += dy / dist * 0.5
+                break
+
+        inputs.left = push_x < -0.1
+        inputs.right = push_x > 0.1
+        inputs.up = push_y < -0.1
+        inputs.down = push_y > 0.1
+
+        if nearest is not None:
+            inputs.aim_angle = math.atan2(nearest.pos.y - py, nearest.pos.x - px)
+
+        # Abilities first, upgrades with whatever mana is left
+        inputs.burst = in_burst >= self.burst_min_targets and player.mana >= ABILITY_BURST_COST
+        inputs.shield = player.hp < player.max_hp * 0.4 and player.mana >= ABILITY_SHIELD_COST
+        inputs.dash = nearest_dist < player.radius * 3 and player.mana >= ABILITY_DASH_COST
+        if not (inputs.burst or inputs.shield or inputs.dash):
+            upgrade = self.upgrade_order[self.next_upgrade]
+            costs = {
+                'upgrade_damage': player.get_damage_upgrade_cost,
+                'upgrade_hp': player.get_hp_upgrade_cost,
+                'upgrade_speed': player.get_speed_upgrade_cost
+            }
+            # Keep a reserve for abilities
+            if player.mana >= costs[upgrade]() + ABILITY_BURST_COST:
+                setattr(inputs, upgrade, True)
+                self.next_upgrade = (self.next_upgrade + 1) % len(self.upgrade_order)
+        return inputs
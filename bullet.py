@@ -1,34 +1,65 @@
 import pygame
 import math
-from config import WORLD_WIDTH, WORLD_HEIGHT
+from config import WORLD_WIDTH, WORLD_HEIGHT, FPS, BULLET_RADIUS, BULLET_POOL_CAPACITY
+
+
+BULLET_COLORS = {
+    'player': (255, 255, 100),
+    'enemy': (255, 100, 100)
+}
 
 
 class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, angle, speed, damage, owner_type='player'):
+    # One pre-rendered image per owner type, shared by every bullet
+    _images = {}
+
+    def __init__(self, x, y, angle, speed, damage, owner_type='player', pool=None):
         super().__init__()
+        self.pool = pool
+        self.in_pool = False
+        self.radius = BULLET_RADIUS
         self.pos = pygame.math.Vector2(x, y)
+        self.prev_pos = self.pos.copy()
+        self.start_pos = self.pos.copy()  # Where the last update's move began (swept collision)
+        self.vel = pygame.math.Vector2(0, 0)
+        self.reset(x, y, angle, speed, damage, owner_type)
+
+    @classmethod
+    def get_image(cls, owner_type):
+        """Shared bullet image for an owner type"""
+        image = cls._images.get(owner_type)
+        if image is None:
+            image = pygame.Surface((BULLET_RADIUS * 2, BULLET_RADIUS * 2), pygame.SRCALPHA)
+            color = BULLET_COLORS.get(owner_type, BULLET_COLORS['enemy'])
+            pygame.draw.circle(image, color, (BULLET_RADIUS, BULLET_RADIUS), BULLET_RADIUS)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            cls._images[owner_type] = image
+        return image
+
+    def reset(self, x, y, angle, speed, damage, owner_type='player'):
+        """(Re)initialize the bullet for a new shot"""
+        self.pos.update(x, y)
+        self.prev_pos.update(x, y)
+        self.start_pos.update(x, y)
         self.angle = angle
         self.speed = speed
         self.damage = damage
         self.owner_type = owner_type
-        self.radius = 4
 
-        self.vel = pygame.math.Vector2(
+        self.vel.update(
             math.cos(angle) * speed,
             math.sin(angle) * speed
         )
 
         # Visual
-        self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        if owner_type == 'player':
-            self.color = (255, 255, 100)
-        else:
-            self.color = (255, 100, 100)
-        pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius)
+        self.color = BULLET_COLORS.get(owner_type, BULLET_COLORS['enemy'])
+        self.image = self.get_image(owner_type)
         self.rect = self.image.get_rect(center=(x, y))
 
     def update(self, dt):
-        self.pos += self.vel
+        self.start_pos.update(self.pos)
+        self.pos += self.vel * (dt * FPS)
         self.rect.center = self.pos
 
         # Check if bullet is outside world bounds
@@ -36,5 +67,72 @@ class Bullet(pygame.sprite.Sprite):
             self.pos.y < 0 or self.pos.y > WORLD_HEIGHT):
             self.kill()
 
+    def kill(self):
+        """Remove from all groups and return to the pool"""
+        super().kill()
+        if self.pool is not None and not self.in_pool:
+            self.pool.release(self)
+
     def draw(self, surface, camera):
         surface.blit(self.image, camera.apply(self.rect))
+
+
+class BulletPool:
+    """Recycles Bullet instances instead of allocating one per shot"""
+
+    def __init__(self, capacity=BULLET_POOL_CAPACITY):
+        self.capacity = capacity  # Max idle bullets kept for reuse
+        self.free = []
+
+        # Stats
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self, x, y, angle, speed, damage, owner_type='player'):
+        """Get a bullet ready to fire, reusing an idle one if possible"""
+        if self.free:
+            bullet = self.free.pop()
+            bullet.in_pool = False
+            bullet.reset(x, y, angle, speed, damage, owner_type)
+            self.reused += 1
+        else:
+            bullet = Bullet(x, y, angle, speed, damage, owner_type, pool=self)
+            self.created += 1
+        return bullet
+
+    def release(self, bullet):
+        """Return a dead bullet to the pool (dropped when the pool is full)"""
+        if len(self.free) < self.capacity:
+            bullet.in_pool = True
+            self.free.append(bullet)
+        else:
+            bullet.pool = None
+            self.discarded += 1
+
+    def reset_stats(self):
+        """Zero the counters (idle bullets are kept for reuse)"""
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    @property
+    def reuse_rate(self):
+        """Fraction of acquired bullets that were recycled"""
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+    def get_stats(self):
+        """Pool counters for profiling"""
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'discarded': self.discarded,
+            'idle': len(self.free),
+            'capacity': self.capacity,
+            'reuse_rate': self.reuse_rate
+        }
+
+
+# Shared pool used by the player and enemies
+bullet_pool = BulletPool()
@@ -1,5 +1,5 @@
 import pygame
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, FPS
 
 
 class Camera:
@@ -8,18 +8,37 @@ class Camera:
         self.y = 0
         self.smoothness = 0.1
 
-    def follow(self, target):
+        # Previous sim step and interpolated render offsets
+        self.prev_x = 0
+        self.prev_y = 0
+        self.render_x = 0
+        self.render_y = 0
+
+    def follow(self, target, dt=1.0 / FPS):
         target_x = target.pos.x - SCREEN_WIDTH // 2
         target_y = target.pos.y - SCREEN_HEIGHT // 2
 
-        self.x += (target_x - self.x) * self.smoothness
-        self.y += (target_y - self.y) * self.smoothness
+        # Smoothness is per 60 Hz tick; compound it for other timesteps
+        smoothness = 1 - (1 - self.smoothness) ** (dt * FPS)
+        self.x += (target_x - self.x) * smoothness
+        self.y += (target_y - self.y) * smoothness
 
         self.x = max(0, min(self.x, WORLD_WIDTH - SCREEN_WIDTH))
         self.y = max(0, min(self.y, WORLD_HEIGHT - SCREEN_HEIGHT))
 
+        self.render_x = self.x
+        self.render_y = self.y
+
+    def store_previous(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def interpolate(self, alpha):
+        self.render_x = self.prev_x + (self.x - self.prev_x) * alpha
+        self.render_y = self.prev_y + (self.y - self.prev_y) * alpha
+
     def apply(self, rect):
-        return pygame.Rect(rect.x - self.x, rect.y - self.y, rect.width, rect.height)
+        return pygame.Rect(rect.x - self.render_x, rect.y - self.render_y, rect.width, rect.height)
 
     def apply_pos(self, x, y):
-        return x - self.x, y - self.y
+        return x - self.render_x, y - self.render_y
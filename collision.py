@@ -0,0 +1,90 @@
+"""
+Batched collision tests.
+Narrow-phase checks for many object pairs at once in NumPy, fed with
+candidate pairs from the spatial hash broad phase (or every object when
+testing a whole group against one circle).
+"""
+
+from itertools import chain
+import numpy as np
+
+
+# Contacts this close together (as a fraction of the move) count as simultaneous
+CONTACT_EPSILON = 1e-9
+
+
+def swept_circle_hits(starts, ends, radii, centers, target_radii):
+    """
+    First contact of circles moving from starts to ends (N x 2) with static
+    circles at centers (N x 2), one pair per row. Returns the fraction of the
+    move (0..1) at which each pair first touches, or inf where it misses.
+    Pairs already touching at the start hit at 0.
+    """
+    move = ends - starts
+    offset = starts - centers
+    reach = radii + target_radii
+
+    # |offset + t * move| = reach  ->  a t^2 + b t + c = 0
+    a = np.einsum('ij,ij->i', move, move)
+    b = 2.0 * np.einsum('ij,ij->i', offset, move)
+    c = np.einsum('ij,ij->i', offset, offset) - reach * reach
+
+    t = np.full(len(starts), np.inf)
+    t[c <= 0] = 0.0
+
+    moving = (c > 0) & (a > 0)
+    disc = b * b - 4.0 * a * c
+    crossing = moving & (disc >= 0)
+    entry = (-b[crossing] - np.sqrt(disc[crossing])) / (2.0 * a[crossing])
+    t[crossing] = np.where((entry >= 0) & (entry <= 1), entry, np.inf)
+    return t
+
+
+def swept_hits(movers, mover_index, targets):
+    """
+    Narrow phase for moving objects (start_pos, pos, radius) against static
+    ones (pos, radius). Each candidate pair from the broad phase is
+    movers[mover_index[i]] against targets[i]. Returns the (mover index,
+    target, contact time) triples that hit, ordered by mover and then by how
+    early along the move (0..1) they touch.
+    """
+    if not targets:
+        return []
+    starts = np.array([(mover.start_pos.x, mover.start_pos.y) for mover in movers])
+    ends = np.array([(mover.pos.x, mover.pos.y) for mover in movers])
+    radii = np.array([mover.radius for mover in movers], dtype=np.float64)
+    centers = np.array([(target.pos.x, target.pos.y) for target in targets])
+    target_radii = np.array([target.radius for target in targets], dtype=np.float64)
+
+    mover_index = np.array(mover_index)
+    t = swept_circle_hits(starts[mover_index], ends[mover_index], radii[mover_index],
+                          centers, target_radii)
+    hit = np.flatnonzero(np.isfinite(t))
+    hit = hit[np.lexsort((t[hit], mover_index[hit]))]
+    return [(m, targets[i], contact)
+            for m, i, contact in zip(mover_index[hit].tolist(), hit.tolist(), t[hit].tolist())]
+
+
+def positions(objects):
+    """(N x 2) array of the objects' pos, gathered without building per-object tuples"""
+    return np.fromiter(chain.from_iterable(obj.pos for obj in objects), np.float64,
+                       count=2 * len(objects)).reshape(-1, 2)
+
+
+def radii(objects):
+    """Array of the objects' radius"""
+    return np.fromiter((obj.radius for obj in objects), np.float64, count=len(objects))
+
+
+def circle_hits(points, radii, center, radius):
+    """
+    Indices of the circles at points (N x 2) with radii (scalar or N) that
+    overlap the circle at center. Circles outside the bounding box are
+    rejected before the exact distance test.
+    """
+    reach = np.broadcast_to(np.asarray(radii, dtype=np.float64) + radius, len(points))
+    dx = points[:, 0] - center[0]
+    dy = points[:, 1] - center[1]
+    near = np.flatnonzero((np.abs(dx) < reach) & (np.abs(dy) < reach))
+    dx, dy, reach = dx[near], dy[near], reach[near]
+    return near[dx * dx + dy * dy < reach * reach]
@@ -1,19 +1,40 @@
+import os
 import pygame
 
+# Headless mode (no window, no display) for simulations on servers and CI.
+# Set PVE_HEADLESS=1 in the environment before config is first imported.
+HEADLESS = os.environ.get('PVE_HEADLESS', '0') not in ('', '0', 'false', 'False')
+HEADLESS_SCREEN_WIDTH = 1280
+HEADLESS_SCREEN_HEIGHT = 720
+
+if HEADLESS:
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
 pygame.init()
 
 # Screen (Fullscreen)
 FULLSCREEN = True
-SCREEN_WIDTH = pygame.display.Info().current_w if FULLSCREEN else 900
-SCREEN_HEIGHT = pygame.display.Info().current_h if FULLSCREEN else 600
+if HEADLESS:
+    SCREEN_WIDTH = HEADLESS_SCREEN_WIDTH
+    SCREEN_HEIGHT = HEADLESS_SCREEN_HEIGHT
+else:
+    SCREEN_WIDTH = pygame.display.Info().current_w if FULLSCREEN else 900
+    SCREEN_HEIGHT = pygame.display.Info().current_h if FULLSCREEN else 600
 
 # World (balanced for fullscreen)
 WORLD_WIDTH = 2400
 WORLD_HEIGHT = 1600
 GRID_SIZE = 50
+SPATIAL_HASH_CELL_SIZE = 64  # Broad-phase collision cell (about two enemy diameters)
+CULL_CELL_SIZE = 256  # Spatial hash cell used for view culling
+CULL_MARGIN = 100  # Extra world pixels drawn around the view (covers explosions)
 
 # Game
-FPS = 60
+FPS = 60  # Reference tick rate: per-tick speeds and forces are tuned for 60 Hz
+SIM_RATE = 60  # Fixed simulation steps per second (can be lowered under load)
+MAX_SIM_STEPS_PER_FRAME = 5  # Drop simulation backlog beyond this many steps
+MAX_RENDER_FPS = 240  # Rendering is decoupled from simulation (0 = uncapped)
 
 # Colors
 BG_COLOR = (20, 25, 30)
@@ -34,6 +55,10 @@ PLAYER_BULLET_SPEED = 12  # Slower bullets
 PLAYER_BULLET_DAMAGE = 7  # Weaker damage
 PLAYER_SHOOT_DELAY = 0.25  # Slower fire rate
 
+# Bullets
+BULLET_RADIUS = 4
+BULLET_POOL_CAPACITY = 2048  # Max idle bullets kept for reuse
+
 # Enemy
 ENEMY_MIN_RADIUS = 10
 ENEMY_MAX_RADIUS = 15
@@ -45,13 +70,35 @@ ENEMY_BULLET_SPEED_MAX = 20
 ENEMY_BULLET_DAMAGE = 5
 ENEMY_SHOOT_DELAY = 2.0
 ENEMY_SHOOT_RANGE = 300
+ENEMY_IMAGE_CACHE_SIZE = 256  # Shared enemy images kept, keyed by (type, radius in pixels)
+
+# Profiler
+PROFILER_WINDOW = 300  # Frames kept for rolling averages and p99 (F3 toggles the overlay)
+
+# Save states
+QUICKSAVE_PATH = 'quicksave.pvs'  # F5 saves the running session here, F9 restores it
+
+# HUD
+HUD_TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept for reuse
+
+# Particles
+PARTICLE_MAX = 4000  # Emits beyond this are dropped
+PARTICLE_DAMPING = 0.95  # Velocity kept per 60 Hz tick
+PARTICLE_GRAVITY = 200
+PARTICLE_ALPHA_LEVELS = 16  # Fade steps for pre-rendered stamps
+PARTICLE_COLOR_STEP = 32  # Colour quantization for pre-rendered stamps
+PARTICLE_STAMP_CACHE_SIZE = 4096
 
 # Mana
 MANA_RADIUS = 6
 MANA_COLLECTION_RADIUS = 150
 MANA_COLLECT_SPEED = 200
+MANA_PICKUP_RADIUS = 20  # Drops this close to the player are collected
 MANA_DROP_AMOUNT_MIN = 3
 MANA_DROP_AMOUNT_MAX = 8
+MANA_PULSE_FRAMES = 16  # Pre-rendered pulse frames per period
+MANA_MAX_DROPS = 150  # Settled drops beyond this are merged with their neighbours
+MANA_MERGE_CELL_SIZE = 48  # Drops in the same cell merge into one
 
 # Upgrades (base costs, increase by 5 per level)
 UPGRADE_DAMAGE_BASE_COST = 10
@@ -162,3 +209,11 @@ ENEMY_TYPES = {
 # Wave System (more enemies, longer game)
 WAVE_BASE_ENEMIES = 5
 WAVE_ENEMY_INCREMENT = 3
+
+# Wave spawning (queued enemies are spread over several frames)
+WAVE_SPAWN_MODE = 'budget'  # 'budget': as many per frame as the time budget allows, 'trickle': staggered
+WAVE_TRICKLE_INTERVAL = 0.25  # Seconds between trickle batches
+WAVE_TRICKLE_BATCH = 2  # Enemies per trickle batch
+SPAWN_FRAME_BUDGET_MS = 2.0  # Max time spent spawning per frame (always at least one enemy)
+SPAWN_MAX_PER_STEP = 4  # Fixed per-step cap used instead of the time budget in headless/recorded/replayed games
+WAVE_PREBUILD_PER_STEP = 2  # Next-wave enemies built per step during the transition countdown
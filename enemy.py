@@ -1,7 +1,7 @@
 from entity import Entity
 from config import (ENEMY_MIN_RADIUS, ENEMY_MAX_RADIUS, ENEMY_HP, ENEMY_FOLLOW_SPEED,
                     ENEMY_STOP_DISTANCE, ENEMY_BULLET_SPEED_MIN, ENEMY_BULLET_SPEED_MAX,
-                    ENEMY_BULLET_DAMAGE, ENEMY_SHOOT_DELAY, ENEMY_SHOOT_RANGE)
+                    ENEMY_BULLET_DAMAGE, ENEMY_SHOOT_DELAY, ENEMY_SHOOT_RANGE, FPS)
 import pygame
 import math
 import random
@@ -40,7 +40,7 @@ class Enemy(Entity):
 
     def update(self, dt, player_pos=None):
         if player_pos:
-            self._follow_player(player_pos)
+            self._follow_player(player_pos, dt * FPS)
 
         super().update(dt)
 
@@ -48,13 +48,13 @@ class Enemy(Entity):
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= dt
 
-    def _follow_player(self, player_pos):
+    def _follow_player(self, player_pos, ticks=1.0):
         distance = self.pos.distance_to(player_pos)
 
         if distance > self.stop_distance:
             # Move towards player
             direction = (player_pos - self.pos).normalize()
-            self.vel += direction * self.follow_speed
+            self.vel += direction * self.follow_speed * ticks
 
     def shoot(self, target_pos):
         """Returns a bullet if ready to shoot and in range, otherwise None"""
@@ -75,8 +75,8 @@ class Enemy(Entity):
             spawn_x = self.pos.x + math.cos(angle) * spawn_distance
             spawn_y = self.pos.y + math.sin(angle) * spawn_distance
 
-            from bullet import Bullet
-            return Bullet(spawn_x, spawn_y, angle, self.bullet_speed, self.bullet_damage, owner_type='enemy')
+            from bullet import bullet_pool
+            return bullet_pool.acquire(spawn_x, spawn_y, angle, self.bullet_speed, self.bullet_damage, owner_type='enemy')
         return None
 
     def take_damage(self, damage):
@@ -0,0 +1,237 @@
+"""
+Array-backed enemy store.
+Keeps enemy physics and AI state in contiguous NumPy arrays (structure of
+arrays) and updates every enemy of a type in one vectorized pass. Enemy sprites
+stay attached to a slot: their hp/cooldowns read straight from the arrays and
+their positions are copied back only when Python code reads them (see
+StorePosition); batch consumers such as the enemy grid use the arrays directly.
+"""
+
+import numpy as np
+from collision import positions, radii
+from config import WORLD_WIDTH, WORLD_HEIGHT, FPS
+
+
+class EnemyStore:
+    """Structure-of-arrays storage and batch update for enemies"""
+
+    # Per-enemy values exposed to sprites through StoreField attributes
+    FIELDS = {
+        'hp': np.float64,
+        'shoot_cooldown': np.float64,
+        'last_bounce_time': np.float64,
+        'is_exploding': np.bool_,
+    }
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.capacity = 0
+        self.sprites = []
+        self.types = []  # enemy_type names, indexed by type_index
+
+        # Physics and AI parameters
+        self.pos = np.zeros((0, 2))
+        self.prev_pos = np.zeros((0, 2))  # Position at the previous sim step (render interpolation)
+        self.vel = np.zeros((0, 2))
+        self.radius = np.zeros(0)
+        self.friction = np.zeros(0)
+        self.follow_speed = np.zeros(0)
+        self.stop_distance = np.zeros(0)
+        self.speed = np.zeros(0)
+        self.shoot_range = np.zeros(0)
+        self.can_shoot = np.zeros(0, dtype=np.bool_)
+        self.type_index = np.zeros(0, dtype=np.int16)
+        self.stale = np.zeros(0, dtype=np.bool_)  # Sprite pos behind the pos array
+        self.fields = {name: np.zeros(0, dtype=dtype) for name, dtype in self.FIELDS.items()}
+
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _arrays(self):
+        arrays = [self.pos, self.prev_pos, self.vel, self.radius, self.friction, self.follow_speed,
+                  self.stop_distance, self.speed, self.shoot_range, self.can_shoot,
+                  self.type_index, self.stale]
+        return arrays + list(self.fields.values())
+
+    def _grow(self, capacity):
+        """Reallocate all arrays with room for capacity enemies"""
+        def grown(array):
+            new = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            new[:self.count] = array[:self.count]
+            return new
+
+        self.pos = grown(self.pos)
+        self.prev_pos = grown(self.prev_pos)
+        self.vel = grown(self.vel)
+        self.radius = grown(self.radius)
+        self.friction = grown(self.friction)
+        self.follow_speed = grown(self.follow_speed)
+        self.stop_distance = grown(self.stop_distance)
+        self.speed = grown(self.speed)
+        self.shoot_range = grown(self.shoot_range)
+        self.can_shoot = grown(self.can_shoot)
+        self.type_index = grown(self.type_index)
+        self.stale = grown(self.stale)
+        self.fields = {name: grown(array) for name, array in self.fields.items()}
+        self.capacity = capacity
+
+    def _type_index_of(self, enemy_type):
+        if enemy_type not in self.types:
+            self.types.append(enemy_type)
+        return self.types.index(enemy_type)
+
+    def add(self, enemy):
+        """Attach an enemy sprite, copying its current state into the arrays"""
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+
+        i = self.count
+        self.pos[i] = enemy.pos
+        self.prev_pos[i] = enemy.prev_pos
+        self.vel[i] = enemy.vel
+        self.radius[i] = enemy.radius
+        self.friction[i] = enemy.friction
+        self.follow_speed[i] = getattr(enemy, 'follow_speed', 0.0)
+        self.stop_distance[i] = getattr(enemy, 'stop_distance', 0.0)
+        self.speed[i] = getattr(enemy, 'speed', 0.0)
+        self.shoot_range[i] = getattr(enemy, 'shoot_range', 0.0)
+        self.can_shoot[i] = hasattr(enemy, 'shoot')
+        self.type_index[i] = self._type_index_of(enemy.enemy_type)
+        self.stale[i] = False
+        for name, array in self.fields.items():
+            array[i] = enemy.__dict__.get(name, 0)
+
+        self.sprites.append(enemy)
+        self.count += 1
+        enemy._store = self
+        enemy._slot = i
+
+    def remove(self, enemy):
+        """Detach an enemy, writing its state back to the sprite"""
+        i = enemy._slot
+        enemy._store = None
+        enemy.__dict__['pos'].update(self.pos[i])
+        enemy.prev_pos.update(self.prev_pos[i])
+        enemy.vel.update(self.vel[i])
+        for name, array in self.fields.items():
+            enemy.__dict__[name] = array[i].item()
+
+        # Move the last enemy into the freed slot
+        last = self.count - 1
+        if i != last:
+            for array in self._arrays():
+                array[i] = array[last]
+            moved = self.sprites[last]
+            self.sprites[i] = moved
+            moved._slot = i
+        self.sprites.pop()
+        self.count -= 1
+
+    def update(self, dt, player_pos):
+        """Advance AI, movement and timers for every enemy type"""
+        for enemy_type in self.types:
+            self.update_type(enemy_type, dt, player_pos)
+
+    def update_type(self, enemy_type, dt, player_pos):
+        """Advance AI, movement and timers for all enemies of one type"""
+        if enemy_type not in self.types:
+            return
+        idx = np.flatnonzero(self.type_index[:self.count] == self.types.index(enemy_type))
+        if len(idx) == 0:
+            return
+
+        ticks = dt * FPS
+        ai = getattr(self.sprites[idx[0]], 'ai', None)
+        if ai == 'follow':
+            self._follow(idx, player_pos, ticks, stop=True)
+        elif ai == 'chase':
+            self._follow(idx, player_pos, ticks, stop=False)
+        elif ai == 'bounce':
+            self._bounce(idx)
+
+        self._integrate(idx, ticks)
+        self.stale[idx] = True
+
+        cooldown = self.fields['shoot_cooldown']
+        cooldown[idx] = np.where(cooldown[idx] > 0, cooldown[idx] - dt, cooldown[idx])
+        if ai == 'bounce':
+            self.fields['last_bounce_time'][idx] += dt
+
+    def _follow(self, idx, player_pos, ticks, stop):
+        """Accelerate towards the player (optionally holding a stop distance)"""
+        delta = np.array((player_pos.x, player_pos.y)) - self.pos[idx]
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        if stop:
+            moving = distance > self.stop_distance[idx]
+        else:
+            moving = ~self.fields['is_exploding'][idx] & (distance > 0)
+
+        idx = idx[moving]
+        direction = delta[moving] / distance[moving, None]
+        self.vel[idx] += direction * (self.follow_speed[idx] * ticks)[:, None]
+
+    def _bounce(self, idx):
+        """Reflect off world borders and keep a constant speed"""
+        pos = self.pos[idx]
+        vel = self.vel[idx]
+        radius = self.radius[idx]
+
+        for axis, limit in ((0, WORLD_WIDTH), (1, WORLD_HEIGHT)):
+            hit = (pos[:, axis] <= radius) | (pos[:, axis] >= limit - radius)
+            vel[hit, axis] *= -1
+            pos[hit, axis] = np.clip(pos[hit, axis], radius[hit], limit - radius[hit])
+
+        length = np.hypot(vel[:, 0], vel[:, 1])
+        moving = length > 0
+        vel[moving] *= (self.speed[idx][moving] / length[moving])[:, None]
+
+        self.pos[idx] = pos
+        self.vel[idx] = vel
+
+    def _integrate(self, idx, ticks):
+        """Apply friction, move and clamp to the world"""
+        vel = self.vel[idx] * (self.friction[idx] ** ticks)[:, None]
+        pos = self.pos[idx] + vel * ticks
+        radius = self.radius[idx]
+        pos[:, 0] = np.clip(pos[:, 0], radius, WORLD_WIDTH - radius)
+        pos[:, 1] = np.clip(pos[:, 1], radius, WORLD_HEIGHT - radius)
+        self.vel[idx] = vel
+        self.pos[idx] = pos
+
+    def store_previous(self):
+        """Remember positions before a sim step for render interpolation"""
+        self.prev_pos[:self.count] = self.pos[:self.count]
+
+    def interpolate(self, slots, alpha):
+        """Positions of the given slots between the previous and current step, as [x, y] lists"""
+        prev = self.prev_pos[slots]
+        return (prev + (self.pos[slots] - prev) * alpha).tolist()
+
+    def ready_to_shoot(self, player_pos):
+        """Enemies whose weapon is ready and the player is in range"""
+        n = self.count
+        delta = self.pos[:n] - (player_pos.x, player_pos.y)
+        in_range = np.hypot(delta[:, 0], delta[:, 1]) <= self.shoot_range[:n]
+        ready = self.can_shoot[:n] & (self.fields['shoot_cooldown'][:n] <= 0) & in_range
+        return [self.sprites[i] for i in np.flatnonzero(ready)]
+
+    def collision_arrays(self, others=()):
+        """
+        (sprites, positions, radii) of the attached enemies followed by others
+        (enemies outside the store), for batch collision passes
+        """
+        n = self.count
+        sprites = self.sprites[:n]
+        points = self.pos[:n]
+        sizes = self.radius[:n]
+        if others:
+            sprites += others
+            points = np.concatenate((points, positions(others)))
+            sizes = np.concatenate((sizes, radii(others)))
+        return sprites, points, sizes
+
+    def exploding(self):
+        """Enemies currently playing their explosion"""
+        return [self.sprites[i] for i in np.flatnonzero(self.fields['is_exploding'][:self.count])]
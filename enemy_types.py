@@ -6,21 +6,36 @@ Easy to extend by adding new classes that inherit from BaseEnemy.
 import pygame
 import math
 import random
-from entity import Entity
-from config import ENEMY_TYPES
+from collections import OrderedDict
+from entity import Entity, StoreField, StorePosition
+from config import ENEMY_TYPES, ENEMY_IMAGE_CACHE_SIZE, FPS
 
 
 class BaseEnemy(Entity):
     """Base class for all enemy types with common functionality"""
 
-    def __init__(self, x, y, enemy_type, difficulty_multipliers):
+    # Movement behaviour used by the vectorized EnemyStore ('follow', 'chase', 'bounce')
+    ai = None
+
+    # Backed by the EnemyStore arrays while attached to one
+    pos = StorePosition()
+    hp = StoreField()
+    shoot_cooldown = StoreField()
+    last_bounce_time = StoreField()
+    is_exploding = StoreField()
+
+    # (enemy_type, radius in whole pixels) -> shared image, least recently used first
+    _images = OrderedDict()
+
+    def __init__(self, x, y, enemy_type, difficulty_multipliers, rng=None):
         self.enemy_type = enemy_type
         self.config = ENEMY_TYPES[enemy_type]
         self.difficulty_multipliers = difficulty_multipliers
+        self.rng = rng if rng is not None else random  # Gameplay stream
 
-        # Random size
-        radius = random.uniform(self.config['min_radius'], self.config['max_radius'])
-        super().__init__(x, y, radius=radius)
+        # Random size (the image is shared by every enemy of this type and pixel radius)
+        radius = self.rng.uniform(self.config['min_radius'], self.config['max_radius'])
+        super().__init__(x, y, radius=radius, image=self.get_image(enemy_type, radius))
 
         self.color = self.config['color']
         self.shape = self.config.get('shape', 'circle')
@@ -31,25 +46,52 @@ class BaseEnemy(Entity):
         self.max_hp = int(base_hp * difficulty_multipliers['enemy_hp_multiplier'])
         self.hp = self.max_hp
 
-        self._draw_image()
-
-    def _draw_image(self):
+    @classmethod
+    def get_image(cls, enemy_type, radius):
+        """Shared image for an enemy type, with radius rounded to whole pixels"""
+        key = (enemy_type, int(round(radius)))
+        image = cls._images.get(key)
+        if image is not None:
+            cls._images.move_to_end(key)
+            return image
+
+        image = cls._render_image(enemy_type, key[1])
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        cls._images[key] = image
+        if len(cls._images) > ENEMY_IMAGE_CACHE_SIZE:
+            cls._images.popitem(last=False)
+        return image
+
+    @staticmethod
+    def _render_image(enemy_type, radius):
         """Draw enemy based on shape type"""
-        self.image.fill((0, 0, 0, 0))
-        center = (self.radius, self.radius)
-
-        if self.shape == 'circle':
-            pygame.draw.circle(self.image, self.color, center, self.radius)
-        elif self.shape == 'square':
-            rect = pygame.Rect(0, 0, self.radius * 2, self.radius * 2)
-            pygame.draw.rect(self.image, self.color, rect)
-        elif self.shape == 'triangle':
+        config = ENEMY_TYPES[enemy_type]
+        color = config['color']
+        shape = config.get('shape', 'circle')
+        image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        center = (radius, radius)
+
+        if shape == 'circle':
+            pygame.draw.circle(image, color, center, radius)
+        elif shape == 'square':
+            rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+            pygame.draw.rect(image, color, rect)
+        elif shape == 'triangle':
             points = [
-                (self.radius, 0),
-                (self.radius * 2, self.radius * 2),
-                (0, self.radius * 2)
+                (radius, 0),
+                (radius * 2, radius * 2),
+                (0, radius * 2)
             ]
-            pygame.draw.polygon(self.image, self.color, points)
+            pygame.draw.polygon(image, color, points)
+        return image
+
+    def kill(self):
+        """Remove from all groups and detach from the enemy store"""
+        store = self.__dict__.get('_store')
+        if store is not None:
+            store.remove(self)
+        super().kill()
 
     def take_damage(self, damage):
         """Take damage and return True if dead"""
@@ -86,8 +128,10 @@ class BaseEnemy(Entity):
 class ShooterEnemy(BaseEnemy):
     """Standard enemy that shoots at player from distance"""
 
-    def __init__(self, x, y, difficulty_multipliers):
-        super().__init__(x, y, 'shooter', difficulty_multipliers)
+    ai = 'follow'
+
+    def __init__(self, x, y, difficulty_multipliers, rng=None):
+        super().__init__(x, y, 'shooter', difficulty_multipliers, rng)
 
         self.follow_speed = self.config['follow_speed'] * difficulty_multipliers['enemy_speed_multiplier']
         self.stop_distance = self.config['stop_distance']
@@ -97,24 +141,24 @@ class ShooterEnemy(BaseEnemy):
 
         base_damage = self.config['bullet_damage']
         self.bullet_damage = int(base_damage * difficulty_multipliers['enemy_damage_multiplier'])
-        self.bullet_speed = random.uniform(
+        self.bullet_speed = self.rng.uniform(
             self.config['bullet_speed_min'],
             self.config['bullet_speed_max']
         )
 
     def update(self, dt, player_pos=None):
         if player_pos:
-            self._follow_player(player_pos)
+            self._follow_player(player_pos, dt * FPS)
         super().update(dt)
 
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= dt
 
-    def _follow_player(self, player_pos):
+    def _follow_player(self, player_pos, ticks=1.0):
         distance = self.pos.distance_to(player_pos)
         if distance > self.stop_distance:
             direction = (player_pos - self.pos).normalize()
-            self.vel += direction * self.follow_speed
+            self.vel += direction * self.follow_speed * ticks
 
     def shoot(self, target_pos):
         """Return bullet if ready to shoot"""
@@ -124,22 +168,24 @@ class ShooterEnemy(BaseEnemy):
             self.shoot_cooldown = self.shoot_delay
 
             angle = math.atan2(target_pos.y - self.pos.y, target_pos.x - self.pos.x)
-            angle += random.uniform(-0.15, 0.15)
+            angle += self.rng.uniform(-0.15, 0.15)
 
             spawn_distance = self.radius + 5
             spawn_x = self.pos.x + math.cos(angle) * spawn_distance
             spawn_y = self.pos.y + math.sin(angle) * spawn_distance
 
-            from bullet import Bullet
-            return Bullet(spawn_x, spawn_y, angle, self.bullet_speed, self.bullet_damage, owner_type='enemy')
+            from bullet import bullet_pool
+            return bullet_pool.acquire(spawn_x, spawn_y, angle, self.bullet_speed, self.bullet_damage, owner_type='enemy')
         return None
 
 
 class ExploderEnemy(BaseEnemy):
     """Enemy that rushes player and explodes on contact"""
 
-    def __init__(self, x, y, difficulty_multipliers):
-        super().__init__(x, y, 'exploder', difficulty_multipliers)
+    ai = 'chase'
+
+    def __init__(self, x, y, difficulty_multipliers, rng=None):
+        super().__init__(x, y, 'exploder', difficulty_multipliers, rng)
 
         self.follow_speed = self.config['follow_speed'] * difficulty_multipliers['enemy_speed_multiplier']
         self.explosion_radius = self.config['explosion_radius']
@@ -151,19 +197,23 @@ class ExploderEnemy(BaseEnemy):
 
     def update(self, dt, player_pos=None):
         if not self.is_exploding and player_pos:
-            self._chase_player(player_pos)
+            self._chase_player(player_pos, dt * FPS)
 
         if self.is_exploding:
-            self.explosion_time += dt
-            if self.explosion_time >= self.explosion_duration:
-                self.kill()
+            self.update_explosion(dt)
 
         super().update(dt)
 
-    def _chase_player(self, player_pos):
+    def update_explosion(self, dt):
+        """Advance the explosion animation and remove when finished"""
+        self.explosion_time += dt
+        if self.explosion_time >= self.explosion_duration:
+            self.kill()
+
+    def _chase_player(self, player_pos, ticks=1.0):
         """Always chase player"""
         direction = (player_pos - self.pos).normalize()
-        self.vel += direction * self.follow_speed
+        self.vel += direction * self.follow_speed * ticks
 
     def explode(self):
         """Trigger explosion"""
@@ -183,8 +233,8 @@ class ExploderEnemy(BaseEnemy):
             pygame.draw.circle(explosion_surface, color, (radius, radius), radius)
 
             pos = camera.apply(pygame.Rect(
-                self.pos.x - radius,
-                self.pos.y - radius,
+                self.rect.centerx - radius,
+                self.rect.centery - radius,
                 radius * 2,
                 radius * 2
             ))
@@ -196,18 +246,20 @@ class ExploderEnemy(BaseEnemy):
 class BouncerEnemy(BaseEnemy):
     """Enemy that bounces around randomly, dealing damage on contact"""
 
-    def __init__(self, x, y, difficulty_multipliers):
-        super().__init__(x, y, 'bouncer', difficulty_multipliers)
+    ai = 'bounce'
+
+    def __init__(self, x, y, difficulty_multipliers, rng=None):
+        super().__init__(x, y, 'bouncer', difficulty_multipliers, rng)
 
         # Bouncers don't use friction
         self.friction = 1.0
 
-        self.speed = random.uniform(
+        self.speed = self.rng.uniform(
             self.config['speed_min'],
             self.config['speed_max']
         ) * difficulty_multipliers['enemy_speed_multiplier']
 
-        angle = random.uniform(0, 2 * math.pi)
+        angle = self.rng.uniform(0, 2 * math.pi)
         self.vel = pygame.math.Vector2(
             math.cos(angle) * self.speed,
             math.sin(angle) * self.speed
@@ -241,8 +293,10 @@ class BouncerEnemy(BaseEnemy):
 class TankEnemy(BaseEnemy):
     """Slow, tanky enemy with high HP"""
 
-    def __init__(self, x, y, difficulty_multipliers):
-        super().__init__(x, y, 'tank', difficulty_multipliers)
+    ai = 'follow'
+
+    def __init__(self, x, y, difficulty_multipliers, rng=None):
+        super().__init__(x, y, 'tank', difficulty_multipliers, rng)
 
         self.follow_speed = self.config['follow_speed'] * difficulty_multipliers['enemy_speed_multiplier']
         self.stop_distance = self.config['stop_distance']
@@ -252,24 +306,24 @@ class TankEnemy(BaseEnemy):
 
         base_damage = self.config['bullet_damage']
         self.bullet_damage = int(base_damage * difficulty_multipliers['enemy_damage_multiplier'])
-        self.bullet_speed = random.uniform(
+        self.bullet_speed = self.rng.uniform(
             self.config['bullet_speed_min'],
             self.config['bullet_speed_max']
         )
 
     def update(self, dt, player_pos=None):
         if player_pos:
-            self._follow_player(player_pos)
+            self._follow_player(player_pos, dt * FPS)
         super().update(dt)
 
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= dt
 
-    def _follow_player(self, player_pos):
+    def _follow_player(self, player_pos, ticks=1.0):
         distance = self.pos.distance_to(player_pos)
         if distance > self.stop_distance:
             direction = (player_pos - self.pos).normalize()
-            self.vel += direction * self.follow_speed
+            self.vel += direction * self.follow_speed * ticks
 
     def shoot(self, target_pos):
         """Return bullet if ready to shoot"""
@@ -279,18 +333,18 @@ class TankEnemy(BaseEnemy):
             self.shoot_cooldown = self.shoot_delay
 
             angle = math.atan2(target_pos.y - self.pos.y, target_pos.x - self.pos.x)
-            angle += random.uniform(-0.1, 0.1)
+            angle += self.rng.uniform(-0.1, 0.1)
 
             spawn_distance = self.radius + 5
             spawn_x = self.pos.x + math.cos(angle) * spawn_distance
             spawn_y = self.pos.y + math.sin(angle) * spawn_distance
 
-            from bullet import Bullet
-            return Bullet(spawn_x, spawn_y, angle, self.bullet_speed, self.bullet_damage, owner_type='enemy')
+            from bullet import bullet_pool
+            return bullet_pool.acquire(spawn_x, spawn_y, angle, self.bullet_speed, self.bullet_damage, owner_type='enemy')
         return None
 
 
-def create_enemy(enemy_type, x, y, difficulty_multipliers):
+def create_enemy(enemy_type, x, y, difficulty_multipliers, rng=None):
     """
     Factory function to create enemies.
 
@@ -298,6 +352,8 @@ def create_enemy(enemy_type, x, y, difficulty_multipliers):
     1. Add config to ENEMY_TYPES in config.py
     2. Create new class inheriting from BaseEnemy
     3. Add mapping here
+
+    rng is the session's gameplay random stream (defaults to the random module).
     """
     enemy_classes = {
         'shooter': ShooterEnemy,
@@ -307,4 +363,4 @@ def create_enemy(enemy_type, x, y, difficulty_multipliers):
     }
 
     enemy_class = enemy_classes.get(enemy_type, ShooterEnemy)
-    return enemy_class(x, y, difficulty_multipliers)
+    return enemy_class(x, y, difficulty_multipliers, rng)
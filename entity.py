@@ -1,17 +1,85 @@
 import pygame
-from config import WORLD_WIDTH, WORLD_HEIGHT
+from config import WORLD_WIDTH, WORLD_HEIGHT, FPS
+
+
+class StoreField:
+    """
+    Attribute that lives in an array store while its owner is attached to one
+    (owner._store / owner._slot) and in the instance dict otherwise.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = obj.__dict__.get('_store')
+        if store is not None:
+            return store.fields[self.name][obj._slot].item()
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj, value):
+        store = obj.__dict__.get('_store')
+        if store is not None:
+            store.fields[self.name][obj._slot] = value
+        else:
+            obj.__dict__[self.name] = value
+
+
+class StorePosition:
+    """
+    pos of an entity attached to an array store (owner._store / owner._slot).
+    The store moves its entities in its pos array and flags them stale; the
+    entity's Vector2 is brought up to date only when it is read.
+    """
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        pos = obj.__dict__['pos']
+        store = obj.__dict__.get('_store')
+        if store is not None:
+            slot = obj._slot
+            if store.stale[slot]:
+                store.stale[slot] = False
+                pos.update(store.pos[slot].tolist())
+        return pos
+
+    def __set__(self, obj, value):
+        obj.__dict__['pos'] = value
+
+
+class DrawGroup(pygame.sprite.Group):
+    """Sprite group that stamps each sprite with the order it was added in (draw order)"""
+
+    def __init__(self, *sprites):
+        self.added = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, *args):
+        super().add_internal(sprite, *args)
+        sprite.draw_order = self.added
+        self.added += 1
 
 
 class Entity(pygame.sprite.Sprite):
-    def __init__(self, x, y, radius=20):
+    def __init__(self, x, y, radius=20, image=None):
         super().__init__()
         self.pos = pygame.math.Vector2(x, y)
+        self.prev_pos = self.pos.copy()  # Position at the previous sim step (render interpolation)
         self.vel = pygame.math.Vector2(0, 0)
         self.radius = radius
         self.acceleration = 0.5
         self.friction = 0.9
 
-        self.image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        # Pass a (shared) image to skip allocating one per entity
+        if image is None:
+            image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        self.image = image
         self.rect = self.image.get_rect(center=(x, y))
 
     def apply_force(self, fx, fy):
@@ -19,8 +87,10 @@ class Entity(pygame.sprite.Sprite):
         self.vel.y += fy
 
     def update(self, dt):
-        self.vel *= self.friction
-        self.pos += self.vel
+        # Velocity and friction are per 60 Hz tick; scale them to the actual timestep
+        ticks = dt * FPS
+        self.vel *= self.friction ** ticks
+        self.pos += self.vel * ticks
 
         self.pos.x = max(self.radius, min(self.pos.x, WORLD_WIDTH - self.radius))
         self.pos.y = max(self.radius, min(self.pos.y, WORLD_HEIGHT - self.radius))
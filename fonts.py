@@ -0,0 +1,19 @@
+"""
+Process-wide font cache.
+pygame.font.Font loads and parses the font file on every call, so each
+(name, size) is created once and shared by the HUD and all menus.
+"""
+
+import functools
+import pygame
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(size, name=None):
+    """Shared Font for a size (name=None is pygame's default font)"""
+    return pygame.font.Font(name, size)
+
+
+def clear_font_cache():
+    """Drop cached fonts (required after pygame.quit())"""
+    get_font.cache_clear()
@@ -4,21 +4,41 @@ Manages game states, menus, gameplay, and win/lose conditions.
 """
 
 import pygame
-import random
+import os
 import math
-from config import (SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, FPS,
+import time
+from itertools import chain
+from config import (SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT,
+                    SIM_RATE, MAX_SIM_STEPS_PER_FRAME, MAX_RENDER_FPS, SPATIAL_HASH_CELL_SIZE,
+                    CULL_CELL_SIZE, CULL_MARGIN,
                     BG_COLOR, BORDER_COLOR, GRID_COLOR, GRID_SIZE,
-                    MANA_DROP_AMOUNT_MIN, MANA_DROP_AMOUNT_MAX, FULLSCREEN,
+                    MANA_DROP_AMOUNT_MIN, MANA_DROP_AMOUNT_MAX, MANA_MAX_DROPS, MANA_MERGE_CELL_SIZE,
+                    MANA_PICKUP_RADIUS, FULLSCREEN, HEADLESS, QUICKSAVE_PATH,
+                    SPAWN_FRAME_BUDGET_MS, SPAWN_MAX_PER_STEP, WAVE_PREBUILD_PER_STEP,
                     ABILITY_DASH_COST, ABILITY_DASH_COOLDOWN,
                     ABILITY_SHIELD_COST, ABILITY_SHIELD_COOLDOWN,
                     ABILITY_BURST_COST, ABILITY_BURST_COOLDOWN)
 from camera import Camera
+from inputs import InputState
 from player import Player
 from mana import ManaDrop
 from enemy_types import create_enemy
+from enemy_store import EnemyStore
+from mana_store import ManaStore
 from wave_manager import WaveManager
 from menu import MainMenu, SettingsMenu, DifficultyMenu, PauseMenu, VictoryScreen, GameOverScreen
-from particles import create_death_particles
+from particles import ParticleSystem
+from spatial_hash import SpatialHash
+from entity import DrawGroup
+from bullet import bullet_pool
+from collision import CONTACT_EPSILON, swept_hits, circle_hits, positions, radii
+from hud import TextCache, build_panel
+from fonts import get_font, clear_font_cache
+from profiler import FrameProfiler
+from rng import SessionRNG, check_seed
+from replay import ReplayRecorder
+from savestate import load_state, save_state_file, load_state_file
+from telemetry import FrameLog
 
 
 class GameState:
@@ -35,21 +55,52 @@ class GameState:
 class Game:
     """Main game class"""
 
-    def __init__(self):
-        if FULLSCREEN:
+    def __init__(self, headless=HEADLESS, telemetry_path=None, seed=None, record_path=None):
+        # Headless games have no window and are driven through step()
+        self.headless = headless
+        self.verbose = not headless
+        if headless:
+            self.window = None
+        elif FULLSCREEN:
             self.window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
         else:
             self.window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption('PVE Arena')
+        if not headless:
+            pygame.display.set_caption('PVE Arena')
         self.clock = pygame.time.Clock()
         self.running = True
 
+        # Fixed-timestep simulation (rendering interpolates between sim steps)
+        self.sim_rate = SIM_RATE
+        self.accumulator = 0.0
+        self.render_alpha = 1.0
+
+        # Per-subsystem frame timings (F3 toggles the overlay)
+        self.profiler = FrameProfiler()
+
+        # Optional per-frame log, written out at wave boundaries
+        self.telemetry = FrameLog(telemetry_path) if telemetry_path else None
+
+        # Per-tick inputs: one-shot presses collected from events until the next
+        # sim step, optionally recorded to a replay file
+        self.pending_input = InputState()
+        self.recorder = ReplayRecorder(record_path) if record_path else None
+        self.replaying = False
+
+        # Time left for spawning queued enemies this frame
+        self.spawn_budget_ms = SPAWN_FRAME_BUDGET_MS
+
         # Game state
         self.state = GameState.MAIN_MENU
         self.difficulty = 'normal'
 
-        # Initialize fonts
+        # Session seed (None = new random seed every game)
+        self.seed = check_seed(seed) if seed is not None else None
+        self.rng = None
+
+        # Initialize fonts and cached HUD surfaces
         self._init_fonts()
+        self._init_hud()
 
         # Initialize menus
         self.main_menu = MainMenu()
@@ -69,40 +120,88 @@ class Game:
         self.enemy_bullets = None
         self.mana_drops = None
         self.particles = None
+        self.enemy_grid = None
+        self.mana_grid = None
+        self.mana_store = None
+        self.enemy_store = None
+        self.custom_enemies = None
+        self.prebuilt_enemies = []
 
         # Wave transition (10 second timer before next wave)
         self.wave_transition = False
         self.wave_timer = 0
         self.wave_timer_duration = 10.0  # 10 seconds between waves
 
+        # Pre-rendered background, grid and border (rebuilt when settings change)
+        self.world_layer = None
+
+        # View culling: enemies come from the collision grid, everything else
+        # from a grid rebuilt at most once per sim step
+        self.draw_grid = SpatialHash(CULL_CELL_SIZE)
+        self.draw_grid_stale = True
+        self.enemy_grid_stale = True
+        self.render_stats = {'drawn': 0, 'culled': 0, 'particles_drawn': 0, 'particles_culled': 0}
+
         # Game surface for pause overlay
         self.game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
 
     def _init_fonts(self):
         """Initialize fonts"""
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
-        self.large_font = pygame.font.Font(None, 48)
-
-    def start_new_game(self):
-        """Initialize a new game session"""
+        self.font = get_font(36)
+        self.small_font = get_font(24)
+        self.large_font = get_font(48)
+
+    def _init_hud(self):
+        """Create the HUD text cache and pre-build static panels"""
+        self.text_cache = TextCache()
+        self.wave_panel = build_panel(350, 120, (20, 30, 40, 200), (100, 200, 255, 100), 3, 15)
+        self.abilities_panel = build_panel(600, 60, (20, 30, 40, 180), (100, 200, 255, 80), 2, 10)
+
+    def start_new_game(self, difficulty=None, seed=None):
+        """Initialize a new game session (seed overrides the game's seed)"""
+        if difficulty is not None:
+            self.difficulty = difficulty
         self.state = GameState.PLAYING
 
+        # All gameplay and particle randomness comes from this session's streams
+        self.rng = SessionRNG(seed if seed is not None else self.seed)
+        if self.verbose:
+            print(f"Session seed: {self.rng.seed}")
+        self.pending_input = InputState()
+        if self.telemetry is not None:
+            self.telemetry.start_session()
+        if self.recorder is not None:
+            self.recorder.start(self.rng.seed, self.difficulty, self.sim_rate)
+
+        # Return the previous session's bullets to the pool and count this session's afresh
+        if self.all_sprites is not None:
+            for bullet in (*self.player_bullets, *self.enemy_bullets):
+                bullet.kill()
+        bullet_pool.reset_stats()
+
         # Initialize sprite groups
         self.camera = Camera()
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = DrawGroup()
         self.enemies = pygame.sprite.Group()
         self.player_bullets = pygame.sprite.Group()
         self.enemy_bullets = pygame.sprite.Group()
         self.mana_drops = pygame.sprite.Group()
-        self.particles = pygame.sprite.Group()
+        self.particles = ParticleSystem(rng=self.rng.cosmetic)
+        self.enemy_grid = SpatialHash(SPATIAL_HASH_CELL_SIZE)
+        self.mana_grid = SpatialHash(MANA_MERGE_CELL_SIZE)
+        self.mana_store = ManaStore()
+        self.enemy_store = EnemyStore()
+        self.custom_enemies = pygame.sprite.Group()  # Enemies without a store AI
+        self.prebuilt_enemies = []  # Next wave, built during the transition
+        self.draw_grid_stale = True
+        self.enemy_grid_stale = True
 
         # Create player with difficulty-based HP
-        self.player = Player(WORLD_WIDTH // 2, WORLD_HEIGHT // 2, self.difficulty)
+        self.player = Player(WORLD_WIDTH // 2, WORLD_HEIGHT // 2, self.difficulty, self.rng.gameplay)
         self.all_sprites.add(self.player)
 
         # Initialize wave manager
-        self.wave_manager = WaveManager(self.difficulty)
+        self.wave_manager = WaveManager(self.difficulty, self.rng.gameplay)
 
         # Start with wave transition
         self.wave_transition = True
@@ -110,39 +209,225 @@ class Game:
 
     def _start_next_wave(self):
         """Start the next wave"""
+        self._flush_telemetry()
         wave_info = self.wave_manager.start_wave()
-        spawn_list = self.wave_manager.get_enemy_spawn_list()
-
-        # Spawn enemies
-        for enemy_type in spawn_list:
-            self._spawn_enemy(enemy_type)
 
-        print(f"Wave {wave_info['wave_number']}/{wave_info['total_waves']} - " +
-              f"Enemies: {wave_info['enemies_count']}")
-
-    def _spawn_enemy(self, enemy_type):
-        """Spawn a single enemy"""
-        x, y = self.wave_manager.get_spawn_position(self.player.pos)
+        # Enemies built during the transition go live at once, placed away from
+        # where the player is now; any the transition did not get to are queued
+        # (see _spawn_queued)
+        for enemy in self.prebuilt_enemies:
+            self._place_enemy(enemy, self.wave_manager.get_spawn_position(self.player.pos))
+            self._add_enemy(enemy)
+        self.prebuilt_enemies = []
+        self.wave_manager.plan_spawns()
+
+        if self.verbose:
+            print(f"Wave {wave_info['wave_number']}/{wave_info['total_waves']} - " +
+                  f"Enemies: {wave_info['enemies_count']}")
+
+    def _spawn_enemy(self, enemy_type, pos=None):
+        """Spawn a single enemy (at the world border unless pos is given)"""
+        return self._add_enemy(self._create_enemy(enemy_type, pos))
+
+    def _create_enemy(self, enemy_type, pos=None):
+        """Build an enemy (image included) without adding it to the game"""
+        if pos is None:
+            pos = self.wave_manager.get_spawn_position(self.player.pos)
+        x, y = pos
         multipliers = self.wave_manager.get_difficulty_multipliers()
-
-        enemy = create_enemy(enemy_type, x, y, multipliers)
+        return create_enemy(enemy_type, x, y, multipliers, self.rng.gameplay)
+
+    def _place_enemy(self, enemy, pos):
+        """Move a built enemy that is not in play yet to pos"""
+        enemy.pos.update(pos)
+        enemy.prev_pos.update(enemy.pos)
+        enemy.rect.center = enemy.pos
+
+    def _add_enemy(self, enemy):
+        """Put a built enemy into play"""
+        if enemy.ai:
+            self.enemy_store.add(enemy)
+        else:
+            self.custom_enemies.add(enemy)
         self.enemies.add(enemy)
         self.all_sprites.add(enemy)
+        self.enemy_grid_stale = True
+        return enemy
+
+    def _prebuild_next_wave(self):
+        """
+        Build a few of the next wave's enemies per step while the transition
+        countdown runs, so starting the wave costs no construction.
+        Runs on the sim thread in fixed steps to keep sessions deterministic.
+        Spawn positions are picked when the wave starts (the player can still
+        move until then).
+        """
+        wave_manager = self.wave_manager
+        if wave_manager.next_wave_types is None:
+            wave_manager.plan_next_wave()
+        pending = wave_manager.next_wave_types
+        for _ in range(min(WAVE_PREBUILD_PER_STEP, len(pending))):
+            self.prebuilt_enemies.append(self._create_enemy(pending.popleft(), (0, 0)))
+
+    def _spawn_queued(self, dt):
+        """
+        Spawn queued wave enemies. Live games spend at most the per-frame time
+        budget; headless, recorded and replayed games use a fixed per-step count
+        so they stay deterministic.
+        """
+        queue = self.wave_manager.spawn_queue
+        allowance = self.wave_manager.spawn_allowance(dt)
+        if allowance == 0:
+            return
+
+        if self.headless or self.recorder is not None or self.replaying:
+            for _ in range(min(allowance, SPAWN_MAX_PER_STEP)):
+                self._spawn_enemy(queue.popleft())
+            return
+
+        start = time.perf_counter()
+        for _ in range(allowance):
+            self._spawn_enemy(queue.popleft())
+            if (time.perf_counter() - start) * 1000.0 >= self.spawn_budget_ms:
+                break
+        self.spawn_budget_ms = max(0.0, self.spawn_budget_ms - (time.perf_counter() - start) * 1000.0)
 
     def run(self):
-        """Main game loop"""
+        """Main game loop: fixed-timestep simulation, rendering as fast as allowed"""
+        profile = self.profiler.section
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
-            self._handle_events()
-            self._update(dt)
-            self._draw()
+            frame_time = self.clock.tick(MAX_RENDER_FPS) / 1000.0
+            frame_start = time.perf_counter()
+            self.spawn_budget_ms = SPAWN_FRAME_BUDGET_MS
+            with profile('events'):
+                self._handle_events()
+
+            sim_dt = 1.0 / self.sim_rate
+            self.accumulator += frame_time
+            steps = 0
+            while self.accumulator >= sim_dt and steps < MAX_SIM_STEPS_PER_FRAME:
+                self._update(sim_dt)
+                self.accumulator -= sim_dt
+                steps += 1
+
+            # Too far behind: drop the backlog instead of spiralling
+            if steps == MAX_SIM_STEPS_PER_FRAME:
+                self.accumulator = min(self.accumulator, sim_dt)
+
+            self._draw(self.accumulator / sim_dt)
+            frame_ms = (time.perf_counter() - frame_start) * 1000.0
+            self.profiler.add('frame', frame_ms)
+            self.profiler.end_frame()
+            if self.state == GameState.PLAYING:
+                self._record_frame(frame_ms)
+        self._flush_telemetry()
+        self._save_recording()
         pygame.quit()
+        clear_font_cache()
+
+    def set_sim_rate(self, rate):
+        """Change the simulation rate (e.g. lower it under load)"""
+        self.sim_rate = rate
+        self.accumulator = 0.0
+
+    def step(self, dt, inputs=None):
+        """
+        Advance gameplay by dt seconds without handling events or drawing.
+        Used by headless simulations; inputs is an InputState (None = no input).
+        Returns the game state after the step.
+        """
+        if self.state == GameState.PLAYING:
+            step_start = time.perf_counter()
+            self._update_gameplay(dt, inputs if inputs is not None else InputState())
+            self.profiler.end_frame()
+            self._record_frame((time.perf_counter() - step_start) * 1000.0)
+        return self.state
+
+    def _record_frame(self, frame_ms):
+        """Buffer one telemetry entry (no-op when telemetry is off)"""
+        if self.telemetry is None:
+            return
+        self.telemetry.record(
+            frame_ms, self.wave_manager.current_wave, len(self.enemies),
+            len(self.player_bullets), len(self.enemy_bullets),
+            len(self.mana_drops), len(self.particles)
+        )
+
+    def _flush_telemetry(self):
+        """Write buffered telemetry to disk"""
+        if self.telemetry is not None:
+            self.telemetry.flush()
+
+    def _save_recording(self):
+        """Write the recorded inputs of the current session to disk"""
+        if self.recorder is not None:
+            self.recorder.save()
+
+    def quicksave(self, path=QUICKSAVE_PATH):
+        """Save the running session to a file"""
+        save_state_file(self, path)
+        if self.verbose:
+            print(f"Saved wave {self.wave_manager.current_wave} to {path}")
+
+    def quickload(self, path=QUICKSAVE_PATH):
+        """Restore a session saved with quicksave() (no-op if there is none)"""
+        if not os.path.exists(path):
+            return False
+        load_state_file(self, path)
+        if self.verbose:
+            print(f"Loaded wave {self.wave_manager.current_wave} from {path}")
+        return True
+
+    def run_replay(self, replay, speed=1.0):
+        """
+        Play back a recorded session tick by tick.
+        speed scales real time (2.0 = twice as fast); 0 runs as fast as possible.
+        Returns the game state when the replay ends.
+        """
+        self.set_sim_rate(replay.sim_rate)
+        self.replaying = True
+        if replay.checkpoint is not None:
+            load_state(self, replay.checkpoint)
+        else:
+            self.start_new_game(replay.difficulty, seed=replay.seed)
+        sim_dt = 1.0 / replay.sim_rate
+        tick_rate = replay.sim_rate * speed if speed > 0 else 0
+
+        for inputs in replay.ticks:
+            if not self.running or self.state != GameState.PLAYING:
+                break
+            self.clock.tick(tick_rate)
+            frame_start = time.perf_counter()
+            if not self.headless:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        self.profiler.show_overlay = not self.profiler.show_overlay
+
+            self._store_previous_positions()
+            self._update_gameplay(sim_dt, inputs)
+            if not self.headless:
+                self._draw(1.0)
+
+            frame_ms = (time.perf_counter() - frame_start) * 1000.0
+            self.profiler.add('frame', frame_ms)
+            self.profiler.end_frame()
+            self._record_frame(frame_ms)
+
+        self.replaying = False
+        self._flush_telemetry()
+        return self.state
 
     def _handle_events(self):
         """Handle events based on game state"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.show_overlay = not self.profiler.show_overlay
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                self.quickload()
 
             # State-specific event handling
             if self.state == GameState.MAIN_MENU:
@@ -176,6 +461,9 @@ class Game:
         action = self.settings_menu.handle_event(event)
         if action == 'back':
             self.state = GameState.MAIN_MENU
+        elif action == 'toggle_grid':
+            # Grid is baked into the world layer
+            self.world_layer = None
         # Settings are applied immediately when toggled
 
     def _handle_difficulty_event(self, event):
@@ -193,31 +481,66 @@ class Game:
             if event.key == pygame.K_ESCAPE:
                 self.pause_menu = PauseMenu()
                 self.state = GameState.PAUSED
-            # Upgrades
+            elif event.key == pygame.K_F5:
+                self.quicksave()
+            # Upgrades and abilities are queued and applied on the next sim step
             elif event.key == pygame.K_1:
-                if self.player.upgrade_damage():
-                    print(f"Damage upgraded to level {self.player.damage_level}!")
+                self.pending_input.upgrade_damage = True
             elif event.key == pygame.K_2:
-                if self.player.upgrade_speed():
-                    print(f"Bullet speed upgraded to level {self.player.speed_level}!")
+                self.pending_input.upgrade_speed = True
             elif event.key == pygame.K_3:
-                if self.player.upgrade_hp():
-                    print(f"HP upgraded to level {self.player.hp_level}!")
-            # Abilities
+                self.pending_input.upgrade_hp = True
             elif event.key == pygame.K_q:
-                self.player.use_dash()
+                self.pending_input.dash = True
             elif event.key == pygame.K_e:
-                self.player.use_shield()
+                self.pending_input.shield = True
             elif event.key == pygame.K_r:
-                burst = self.player.use_burst()
-                if burst:
-                    self._handle_burst(burst)
+                self.pending_input.burst = True
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
-                bullet = self.player.shoot()
-                if bullet:
-                    self.player_bullets.add(bullet)
-                    self.all_sprites.add(bullet)
+                self.pending_input.shoot = True
+
+    def _apply_inputs(self, inputs):
+        """Apply one-shot actions (shooting, abilities, upgrades) from an InputState"""
+        if inputs.upgrade_damage:
+            self._upgrade_damage()
+        if inputs.upgrade_speed:
+            self._upgrade_speed()
+        if inputs.upgrade_hp:
+            self._upgrade_hp()
+        if inputs.dash:
+            self.player.use_dash()
+        if inputs.shield:
+            self.player.use_shield()
+        if inputs.burst:
+            self._use_burst()
+        if inputs.shoot:
+            self._player_shoot()
+
+    def _player_shoot(self):
+        """Fire a player bullet if the weapon is ready"""
+        bullet = self.player.shoot()
+        if bullet:
+            self.player_bullets.add(bullet)
+            self.all_sprites.add(bullet)
+
+    def _use_burst(self):
+        """Trigger the burst ability if available"""
+        burst = self.player.use_burst()
+        if burst:
+            self._handle_burst(burst)
+
+    def _upgrade_damage(self):
+        if self.player.upgrade_damage() and self.verbose:
+            print(f"Damage upgraded to level {self.player.damage_level}!")
+
+    def _upgrade_speed(self):
+        if self.player.upgrade_speed() and self.verbose:
+            print(f"Bullet speed upgraded to level {self.player.speed_level}!")
+
+    def _upgrade_hp(self):
+        if self.player.upgrade_hp() and self.verbose:
+            print(f"HP upgraded to level {self.player.hp_level}!")
 
     def _handle_pause_event(self, event):
         """Handle pause menu events"""
@@ -251,99 +574,209 @@ class Game:
     def _update(self, dt):
         """Update game based on state"""
         if self.state == GameState.PLAYING:
-            self._update_gameplay(dt)
+            self._store_previous_positions()
+            self._update_gameplay(dt, self._collect_live_input())
+
+    def _collect_live_input(self):
+        """Held keys and mouse aim plus presses queued since the last sim step"""
+        inputs = InputState.from_pygame(self.player, self.camera)
+        pending = self.pending_input
+        for name in ('shoot', 'dash', 'shield', 'burst',
+                     'upgrade_damage', 'upgrade_speed', 'upgrade_hp'):
+            setattr(inputs, name, getattr(pending, name))
+        self.pending_input = InputState()
+        return inputs
+
+    def _store_previous_positions(self):
+        """Remember positions before a sim step for render interpolation"""
+        for sprite in chain((self.player,), self.player_bullets, self.enemy_bullets, self.custom_enemies):
+            sprite.prev_pos.update(sprite.pos)
+        # Store enemies and drops keep theirs in arrays
+        self.enemy_store.store_previous()
+        self.mana_store.store_previous()
+        self.particles.store_previous()
+        self.camera.store_previous()
+
+    def _interpolate(self, alpha):
+        """
+        Place the camera between the last two sim states for drawing; sprites
+        are placed when they are drawn (see _place_for_drawing)
+        """
+        alpha = min(alpha, 1.0)
+        self.camera.interpolate(alpha)
+        self.render_alpha = alpha
+
+    def _place_for_drawing(self, sprites):
+        """Put the sprites about to be drawn between their last two sim positions"""
+        alpha = self.render_alpha
+        attached = {}
+        for sprite in sprites:
+            store = sprite.__dict__.get('_store')
+            if store is None:
+                sprite.rect.center = sprite.prev_pos.lerp(sprite.pos, alpha)
+            else:
+                attached.setdefault(store, []).append(sprite)
+
+        # Sprites in an array store are interpolated in one pass per store
+        for store, group in attached.items():
+            centers = store.interpolate([sprite._slot for sprite in group], alpha)
+            for sprite, center in zip(group, centers):
+                sprite.rect.center = center
+
+    def _update_gameplay(self, dt, inputs=None):
+        """Update gameplay logic (inputs=None reads the live keyboard and mouse)"""
+        self.draw_grid_stale = True
+        if inputs is not None:
+            if self.recorder is not None:
+                self.recorder.record(inputs)
+            self._apply_inputs(inputs)
 
-    def _update_gameplay(self, dt):
-        """Update gameplay logic"""
         # Handle wave transition timer
         if self.wave_transition:
             self.wave_timer -= dt
             if self.wave_timer <= 0:
                 self._start_next_wave()
                 self.wave_transition = False
+            else:
+                with self.profiler.section('prebuild'):
+                    self._prebuild_next_wave()
             # Don't update entities during transition - game is paused
             return
 
         # Update game only when not in transition
-        self._update_entities(dt)
+        with self.profiler.section('spawn'):
+            self._spawn_queued(dt)
+        with self.profiler.section('update_entities'):
+            self._update_entities(dt, inputs)
         self._handle_collisions()
         self._check_wave_completion()
 
-        self.camera.follow(self.player)
+        self.camera.follow(self.player, dt)
         self._check_game_state()
 
-    def _update_entities(self, dt):
+    def _update_entities(self, dt, inputs=None):
         """Update all entities"""
-        self.player.update(dt, self.camera)
+        self.player.update(dt, self.camera, inputs)
 
-        # Update enemies
-        for enemy in self.enemies:
+        # Update enemies (vectorized per type in the enemy store)
+        self.enemy_store.update(dt, self.player.pos)
+        for enemy in self.enemy_store.exploding():
+            enemy.update_explosion(dt)
+
+        # Enemy types with their own update() run per object
+        for enemy in self.custom_enemies:
             enemy.update(dt, self.player.pos)
 
-            # Enemy shooting
-            if hasattr(enemy, 'shoot'):
-                bullet = enemy.shoot(self.player.pos)
-                if bullet:
-                    self.enemy_bullets.add(bullet)
-                    self.all_sprites.add(bullet)
+        # Enemy shooting
+        shooters = self.enemy_store.ready_to_shoot(self.player.pos)
+        shooters += [enemy for enemy in self.custom_enemies if hasattr(enemy, 'shoot')]
+        for enemy in shooters:
+            bullet = enemy.shoot(self.player.pos)
+            if bullet:
+                self.enemy_bullets.add(bullet)
+                self.all_sprites.add(bullet)
 
-        # Update bullets, mana, and particles
+        # Update bullets, mana (vectorized in the mana store), and particles
         self.player_bullets.update(dt)
         self.enemy_bullets.update(dt)
-        for mana in self.mana_drops:
-            mana.update(dt, self.player.pos)
+        self.mana_store.update(dt, self.player.pos)
+        self.mana_store.sync()
+        if len(self.mana_drops) > MANA_MAX_DROPS:
+            self._coalesce_mana()
         self.particles.update(dt)
 
     def _handle_collisions(self):
         """Handle all collisions"""
-        self._handle_bullet_enemy_collision()
-        self._handle_bullet_player_collision()
-        self._handle_enemy_player_collision()
-        self._handle_mana_collection()
+        profile = self.profiler.section
+        with profile('enemy_grid'):
+            self._rebuild_enemy_grid()
+        with profile('bullet_enemy_collision'):
+            self._handle_bullet_enemy_collision()
+        with profile('bullet_player_collision'):
+            self._handle_bullet_player_collision()
+        with profile('enemy_player_collision'):
+            self._handle_enemy_player_collision()
+        with profile('mana_collection'):
+            self._handle_mana_collection()
+
+    def _rebuild_enemy_grid(self):
+        """Re-bucket every enemy, reading store enemies' positions from its arrays"""
+        self.enemy_grid.rebuild_points(*self.enemy_store.collision_arrays(self.custom_enemies.sprites()))
+        self.enemy_grid_stale = False
 
     def _handle_bullet_enemy_collision(self):
-        """Handle bullets hitting enemies"""
+        """
+        Handle bullets hitting enemies. Each bullet is swept along its move
+        this step, so fast bullets cannot pass through an enemy between
+        steps; it stops at its first contact, hitting every enemy it touches
+        at that moment.
+        """
+        query_rect = self.enemy_grid.query_rect
+        bullets = []
+        bullet_index = []
+        candidates = []
         for bullet in self.player_bullets:
-            hit_enemies = pygame.sprite.spritecollide(
-                bullet, self.enemies, False, pygame.sprite.collide_circle
-            )
-            if hit_enemies:
-                bullet.kill()
-                for enemy in hit_enemies:
-                    if enemy.take_damage(bullet.damage):
-                        # Create death particles
-                        particles = create_death_particles(enemy.pos.x, enemy.pos.y, enemy.color)
-                        self.particles.add(particles)
-
-                        self._spawn_mana(enemy.pos.x, enemy.pos.y)
-                        enemy.kill()
-                        self.wave_manager.enemy_killed()
+            (x0, y0), (x1, y1), reach = bullet.start_pos, bullet.pos, bullet.radius
+            if x0 > x1:
+                x0, x1 = x1, x0
+            if y0 > y1:
+                y0, y1 = y1, y0
+            # Only test enemies in the cells around the bullet's path
+            found = query_rect(x0 - reach, y0 - reach, x1 + reach, y1 + reach)
+            if found:
+                bullet_index += [len(bullets)] * len(found)
+                bullets.append(bullet)
+                candidates += found
+
+        contact = None  # (bullet index, time of its first contact)
+        for b, enemy, t in swept_hits(bullets, bullet_index, candidates):
+            if contact is not None and contact[0] == b and t > contact[1] + CONTACT_EPSILON:
+                continue
+            # An earlier bullet may already have killed this enemy
+            if not enemy.alive():
+                continue
+            if contact is None or contact[0] != b:
+                contact = (b, t)
+            bullet = bullets[b]
+            bullet.kill()
+            if enemy.take_damage(bullet.damage):
+                # Create death particles
+                self.particles.emit(enemy.pos.x, enemy.pos.y, enemy.color)
+
+                self._spawn_mana(enemy.pos.x, enemy.pos.y)
+                enemy.kill()
+                self.wave_manager.enemy_killed()
 
     def _handle_bullet_player_collision(self):
-        """Handle enemy bullets hitting player"""
-        for bullet in self.enemy_bullets:
-            distance = bullet.pos.distance_to(self.player.pos)
-            if distance < bullet.radius + self.player.radius:
-                self.player.take_damage(bullet.damage)
-                bullet.kill()
+        """Handle enemy bullets hitting player (one batch test over every bullet)"""
+        bullets = self.enemy_bullets.sprites()
+        if not bullets:
+            return
+        hits = circle_hits(positions(bullets), radii(bullets), self.player.pos, self.player.radius)
+        for i in hits.tolist():
+            bullet = bullets[i]
+            self.player.take_damage(bullet.damage)
+            bullet.kill()
 
     def _handle_enemy_player_collision(self):
-        """Handle enemies colliding with player"""
-        for enemy in self.enemies:
-            distance = enemy.pos.distance_to(self.player.pos)
-            if distance < enemy.radius + self.player.radius:
-                # Handle exploder
-                if hasattr(enemy, 'explode') and not enemy.is_exploding:
-                    enemy.explode()
-                    # Check if player is in explosion radius
-                    if distance < enemy.explosion_radius:
-                        self.player.take_damage(enemy.explosion_damage)
-
-                # Handle bouncer
-                elif hasattr(enemy, 'bounce_damage'):
-                    if enemy.last_bounce_time >= enemy.bounce_cooldown:
-                        self.player.take_damage(enemy.bounce_damage)
-                        enemy.last_bounce_time = 0
+        """Handle enemies colliding with player (one batch test over every enemy)"""
+        enemies, points, sizes = self.enemy_store.collision_arrays(self.custom_enemies.sprites())
+        if not enemies:
+            return
+        for i in circle_hits(points, sizes, self.player.pos, self.player.radius).tolist():
+            enemy = enemies[i]
+            # Handle exploder
+            if hasattr(enemy, 'explode') and not enemy.is_exploding:
+                enemy.explode()
+                # Check if player is in explosion radius
+                if enemy.pos.distance_to(self.player.pos) < enemy.explosion_radius:
+                    self.player.take_damage(enemy.explosion_damage)
+
+            # Handle bouncer
+            elif hasattr(enemy, 'bounce_damage'):
+                if enemy.last_bounce_time >= enemy.bounce_cooldown:
+                    self.player.take_damage(enemy.bounce_damage)
+                    enemy.last_bounce_time = 0
 
     def _handle_burst(self, burst_data):
         """Handle player burst ability damage"""
@@ -352,45 +785,68 @@ class Game:
         burst_damage = burst_data['damage']
 
         # Create visual effect
-        from particles import create_death_particles
-        for _ in range(30):
-            particles = create_death_particles(burst_pos.x, burst_pos.y, (255, 200, 100), count=5)
-            self.particles.add(particles)
+        self.particles.emit(burst_pos.x, burst_pos.y, (255, 200, 100), count=150)
 
         # Damage enemies in radius
         for enemy in self.enemies:
             distance = enemy.pos.distance_to(burst_pos)
             if distance < burst_radius:
                 if enemy.take_damage(burst_damage):
-                    particles = create_death_particles(enemy.pos.x, enemy.pos.y, enemy.color)
-                    self.particles.add(particles)
+                    self.particles.emit(enemy.pos.x, enemy.pos.y, enemy.color)
                     self._spawn_mana(enemy.pos.x, enemy.pos.y)
                     enemy.kill()
                     self.wave_manager.enemy_killed()
 
     def _handle_mana_collection(self):
-        """Handle player collecting mana"""
-        for mana in self.mana_drops:
-            distance = mana.pos.distance_to(self.player.pos)
-            if distance < 20:
-                self.player.collect_mana(mana.amount)
+        """Handle player collecting mana (one collect_mana call for every drop picked up)"""
+        collected, amount = self.mana_store.collect(self.player.pos, MANA_PICKUP_RADIUS)
+        if collected:
+            self.player.collect_mana(amount)
+            for mana in collected:
                 mana.kill()
 
+    def _coalesce_mana(self):
+        """
+        Merge settled drops that share a grid cell into the oldest one until
+        the drop count is down to MANA_MAX_DROPS (oldest cells first). If that
+        is not enough (drops too spread out), the oldest drops are merged into
+        their nearest neighbours.
+        """
+        excess = len(self.mana_drops) - MANA_MAX_DROPS
+        self.mana_grid.rebuild(self.mana_store.settled())
+        for bucket in self.mana_grid.cells.values():
+            keeper = bucket[0]
+            for mana in bucket[1:]:
+                keeper.amount += mana.amount
+                mana.kill()
+                excess -= 1
+                if excess <= 0:
+                    return
+
+        for mana in self.mana_store.merge_oldest(excess):
+            mana.kill()
+
     def _spawn_mana(self, x, y):
         """Spawn mana at position"""
-        amount = random.randint(MANA_DROP_AMOUNT_MIN, MANA_DROP_AMOUNT_MAX)
-        mana = ManaDrop(x, y, amount=amount)
+        amount = self.rng.gameplay.randint(MANA_DROP_AMOUNT_MIN, MANA_DROP_AMOUNT_MAX)
+        self._add_mana(ManaDrop(x, y, amount=amount))
+
+    def _add_mana(self, mana):
+        """Put a mana drop into the world and the mana store"""
+        self.mana_store.add(mana)
         self.mana_drops.add(mana)
         self.all_sprites.add(mana)
 
     def _check_wave_completion(self):
         """Check if wave is complete and start next"""
         if self.wave_manager.is_wave_complete() and len(self.enemies) == 0:
+            self._flush_telemetry()
             if self.wave_manager.is_game_won():
                 self.victory_screen = VictoryScreen(
                     self.difficulty, self.wave_manager.current_wave
                 )
                 self.state = GameState.VICTORY
+                self._save_recording()
             else:
                 # Start wave transition (10 second wait before next wave)
                 self.wave_transition = True
@@ -401,9 +857,11 @@ class Game:
         if self.player.hp <= 0:
             self.game_over_screen = GameOverScreen(self.wave_manager.current_wave)
             self.state = GameState.GAME_OVER
+            self._flush_telemetry()
+            self._save_recording()
 
-    def _draw(self):
-        """Draw based on game state"""
+    def _draw(self, alpha=1.0):
+        """Draw based on game state (alpha: progress towards the next sim step)"""
         if self.state == GameState.MAIN_MENU:
             self.main_menu.draw(self.window)
         elif self.state == GameState.SETTINGS:
@@ -411,6 +869,7 @@ class Game:
         elif self.state == GameState.DIFFICULTY:
             self.difficulty_menu.draw(self.window)
         elif self.state == GameState.PLAYING:
+            self._interpolate(alpha)
             self._draw_gameplay()
         elif self.state == GameState.PAUSED:
             self.pause_menu.draw(self.window, self.game_surface)
@@ -419,50 +878,90 @@ class Game:
         elif self.state == GameState.GAME_OVER:
             self.game_over_screen.draw(self.window)
 
-        pygame.display.flip()
+        if self.profiler.show_overlay:
+            self.profiler.draw(self.window, self.small_font, self.text_cache)
+
+        with self.profiler.section('display_flip'):
+            pygame.display.flip()
 
     def _draw_gameplay(self):
         """Draw gameplay elements"""
-        self.game_surface.fill(BG_COLOR)
+        profile = self.profiler.section
+        with profile('draw_world'):
+            self._draw_world()
+        with profile('draw_sprites'):
+            self._draw_sprites()
+        with profile('draw_ui'):
+            self._draw_ui()
+        if self.window is not None:  # Headless games draw to game_surface only
+            self.window.blit(self.game_surface, (0, 0))
+
+    def _build_world_layer(self):
+        """Bake background, grid and world border into one cached surface"""
+        layer = pygame.Surface((WORLD_WIDTH, WORLD_HEIGHT))
+        layer.fill(BG_COLOR)
+
         if self.settings_menu.show_grid:
-            self._draw_grid()
-        self._draw_world_border()
-        self._draw_sprites()
-        self._draw_ui()
-        self.window.blit(self.game_surface, (0, 0))
-
-    def _draw_grid(self):
-        """Draw world grid"""
-        start_x = max(0, int(self.camera.x // GRID_SIZE) * GRID_SIZE)
-        start_y = max(0, int(self.camera.y // GRID_SIZE) * GRID_SIZE)
-        end_x = min(WORLD_WIDTH, int((self.camera.x + SCREEN_WIDTH) // GRID_SIZE + 1) * GRID_SIZE)
-        end_y = min(WORLD_HEIGHT, int((self.camera.y + SCREEN_HEIGHT) // GRID_SIZE + 1) * GRID_SIZE)
-
-        for x in range(start_x, end_x + GRID_SIZE, GRID_SIZE):
-            screen_x = x - self.camera.x
-            pygame.draw.line(self.game_surface, GRID_COLOR, (screen_x, 0), (screen_x, SCREEN_HEIGHT))
-
-        for y in range(start_y, end_y + GRID_SIZE, GRID_SIZE):
-            screen_y = y - self.camera.y
-            pygame.draw.line(self.game_surface, GRID_COLOR, (0, screen_y), (SCREEN_WIDTH, screen_y))
-
-    def _draw_world_border(self):
-        """Draw world boundary"""
-        rect = self.camera.apply(pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT))
-        pygame.draw.rect(self.game_surface, BORDER_COLOR, rect, 3)
+            for x in range(0, WORLD_WIDTH + GRID_SIZE, GRID_SIZE):
+                pygame.draw.line(layer, GRID_COLOR, (x, 0), (x, WORLD_HEIGHT))
+            for y in range(0, WORLD_HEIGHT + GRID_SIZE, GRID_SIZE):
+                pygame.draw.line(layer, GRID_COLOR, (0, y), (WORLD_WIDTH, y))
+
+        pygame.draw.rect(layer, BORDER_COLOR, (0, 0, WORLD_WIDTH, WORLD_HEIGHT), 3)
+
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        self.world_layer = layer
+
+    def _draw_world(self):
+        """Draw the visible part of the static world layer"""
+        if self.world_layer is None:
+            self._build_world_layer()
+
+        view = pygame.Rect(int(self.camera.render_x), int(self.camera.render_y),
+                           SCREEN_WIDTH, SCREEN_HEIGHT)
+        # Screens larger than the world show background around it
+        if not self.world_layer.get_rect().contains(view):
+            self.game_surface.fill(BG_COLOR)
+        self.game_surface.blit(self.world_layer, (0, 0), view)
 
     def _draw_sprites(self):
-        """Draw all sprites"""
-        for sprite in self.all_sprites:
+        """Draw sprites inside the view (plus a margin); everything else is culled"""
+        # Grids only change when the simulation steps, not every rendered frame
+        if self.enemy_grid_stale:
+            self._rebuild_enemy_grid()
+        if self.draw_grid_stale:
+            self.draw_grid.rebuild(chain((self.player,), self.player_bullets,
+                                         self.enemy_bullets, self.mana_drops))
+            self.draw_grid_stale = False
+
+        left = self.camera.render_x - CULL_MARGIN
+        top = self.camera.render_y - CULL_MARGIN
+        right = left + SCREEN_WIDTH + 2 * CULL_MARGIN
+        bottom = top + SCREEN_HEIGHT + 2 * CULL_MARGIN
+        visible = self.draw_grid.query_rect(left, top, right, bottom)
+        # Enemies killed since the collision pass are still in its grid
+        visible += [enemy for enemy in self.enemy_grid.query_rect(left, top, right, bottom) if enemy.alive()]
+        # Same order as drawing the whole group (order added)
+        visible.sort(key=lambda sprite: sprite.draw_order)
+        self._place_for_drawing(visible)
+
+        show_health_bars = self.settings_menu.show_health_bars
+        for sprite in visible:
             # Pass health bar setting to enemies
             if hasattr(sprite, 'enemy_type'):
-                sprite.draw(self.game_surface, self.camera, self.settings_menu.show_health_bars)
+                sprite.draw(self.game_surface, self.camera, show_health_bars)
             else:
                 sprite.draw(self.game_surface, self.camera)
 
         # Draw particles on top
-        for particle in self.particles:
-            particle.draw(self.game_surface, self.camera)
+        particles_drawn = self.particles.draw(self.game_surface, self.camera, self.render_alpha)
+
+        stats = self.render_stats
+        stats['drawn'] = len(visible)
+        stats['culled'] = len(self.all_sprites) - len(visible)
+        stats['particles_drawn'] = particles_drawn
+        stats['particles_culled'] = len(self.particles) - particles_drawn
 
     def _draw_ui(self):
         """Draw UI elements"""
@@ -491,59 +990,55 @@ class Game:
 
         pygame.draw.rect(self.game_surface, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 2)
 
-        hp_text = self.small_font.render(
+        hp_text = self.text_cache.render(
+            self.small_font,
             f'HP: {int(self.player.hp)}/{int(self.player.max_hp)}',
-            True, (255, 255, 255)
+            (255, 255, 255)
         )
         self.game_surface.blit(hp_text, (bar_x + 5, bar_y + 3))
 
     def _draw_mana_counter(self):
         """Draw mana counter"""
-        mana_text = self.font.render(f'Mana: {int(self.player.mana)}', True, (150, 230, 255))
+        mana_text = self.text_cache.render(self.font, f'Mana: {int(self.player.mana)}', (150, 230, 255))
         self.game_surface.blit(mana_text, (20, 60))
 
     def _draw_wave_info(self):
         """Draw wave information"""
-        wave_text = self.font.render(
+        wave_text = self.text_cache.render(
+            self.font,
             f'Wave: {self.wave_manager.current_wave}/{self.wave_manager.waves_to_win}',
-            True, (255, 200, 100)
+            (255, 200, 100)
         )
         wave_rect = wave_text.get_rect(center=(SCREEN_WIDTH // 2, 30))
         self.game_surface.blit(wave_text, wave_rect)
 
         # Enemies remaining
-        enemies_text = self.small_font.render(
+        enemies_text = self.text_cache.render(
+            self.small_font,
             f'Enemies: {len(self.enemies)}',
-            True, (200, 200, 200)
+            (200, 200, 200)
         )
         enemies_rect = enemies_text.get_rect(center=(SCREEN_WIDTH // 2, 60))
         self.game_surface.blit(enemies_text, enemies_rect)
 
     def _draw_wave_transition(self):
         """Draw wave transition timer"""
-        # Semi-transparent panel
-        panel_width = 350
-        panel_height = 120
+        # Semi-transparent panel (pre-built)
+        panel_width, panel_height = self.wave_panel.get_size()
         panel_x = SCREEN_WIDTH // 2 - panel_width // 2
         panel_y = 50
-
-        # Background panel
-        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        pygame.draw.rect(panel, (20, 30, 40, 200), (0, 0, panel_width, panel_height), border_radius=15)
-        pygame.draw.rect(panel, (100, 200, 255, 100), (0, 0, panel_width, panel_height), 3, border_radius=15)
-        self.game_surface.blit(panel, (panel_x, panel_y))
+        self.game_surface.blit(self.wave_panel, (panel_x, panel_y))
 
         # Wave text
-        wave_text = self.font.render('Next Wave In...', True, (150, 200, 255))
+        wave_text = self.text_cache.render(self.font, 'Next Wave In...', (150, 200, 255))
         wave_rect = wave_text.get_rect(center=(SCREEN_WIDTH // 2, panel_y + 30))
         self.game_surface.blit(wave_text, wave_rect)
 
-        # Timer with pulsing effect
+        # Timer with pulsing effect (one cached font and glyph per size)
         seconds = math.ceil(self.wave_timer)
         pulse = abs(math.sin(self.wave_timer * 4)) * 10
         timer_size = 48 + int(pulse)
-        timer_font = pygame.font.Font(None, timer_size)
-        timer_text = timer_font.render(str(seconds), True, (255, 200, 100))
+        timer_text = self.text_cache.render(get_font(timer_size), str(seconds), (255, 200, 100))
         timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, panel_y + 70))
         self.game_surface.blit(timer_text, timer_rect)
 
@@ -565,7 +1060,7 @@ class Game:
     def _draw_upgrades(self):
         """Draw upgrade info"""
         upgrade_y = SCREEN_HEIGHT - 200
-        title = self.small_font.render('Upgrades:', True, (200, 200, 200))
+        title = self.text_cache.render(self.small_font, 'Upgrades:', (200, 200, 200))
         self.game_surface.blit(title, (20, upgrade_y))
 
         # Get current costs
@@ -580,19 +1075,14 @@ class Game:
         ]
 
         for text, y_offset in upgrades:
-            upgrade_text = self.small_font.render(text, True, (255, 200, 100))
+            upgrade_text = self.text_cache.render(self.small_font, text, (255, 200, 100))
             self.game_surface.blit(upgrade_text, (20, upgrade_y + y_offset))
 
     def _draw_controls(self):
         """Draw controls and abilities"""
-        # Abilities panel
+        # Abilities panel (pre-built)
         abilities_y = SCREEN_HEIGHT - 110
-        panel_width = 600
-        panel_height = 60
-        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        pygame.draw.rect(panel, (20, 30, 40, 180), (0, 0, panel_width, panel_height), border_radius=10)
-        pygame.draw.rect(panel, (100, 200, 255, 80), (0, 0, panel_width, panel_height), 2, border_radius=10)
-        self.game_surface.blit(panel, (20, abilities_y))
+        self.game_surface.blit(self.abilities_panel, (20, abilities_y))
 
         # Ability info
         abilities = [
@@ -611,11 +1101,11 @@ class Game:
             else:
                 color = (255, 200, 100)
 
-            ability_text = self.small_font.render(text, True, color)
+            ability_text = self.text_cache.render(self.small_font, text, color)
             self.game_surface.blit(ability_text, (x_offset, abilities_y + 20))
             x_offset += 190
 
         # Controls hint
         hint = 'WASD: Move | Click: Shoot | 1,2,3: Upgrade | ESC: Pause'
-        hint_text = self.small_font.render(hint, True, (120, 120, 120))
+        hint_text = self.text_cache.render(self.small_font, hint, (120, 120, 120))
         self.game_surface.blit(hint_text, (20, SCREEN_HEIGHT - 35))
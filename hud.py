@@ -0,0 +1,53 @@
+"""
+HUD rendering helpers.
+Caches rendered text and pre-builds static panels so the in-game HUD only
+re-renders the labels whose values actually changed.
+"""
+
+from collections import OrderedDict
+import pygame
+from config import HUD_TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """LRU cache of rendered text keyed by font, string and colour"""
+
+    def __init__(self, max_size=HUD_TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def render(self, font, text, color):
+        """Return the rendered surface, rendering only on a cache miss"""
+        key = (font, text, color)
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self._cache[key] = surface
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._cache.clear()
+
+
+def build_panel(width, height, fill_color, border_color, border_width, border_radius):
+    """Pre-render a semi-transparent rounded panel"""
+    panel = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(panel, fill_color, (0, 0, width, height), border_radius=border_radius)
+    pygame.draw.rect(panel, border_color, (0, 0, width, height), border_width, border_radius=border_radius)
+    if pygame.display.get_surface() is not None:
+        panel = panel.convert_alpha()
+    return panel
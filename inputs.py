@@ -0,0 +1,52 @@
+"""
+Player input snapshots.
+Decouples gameplay from pygame's keyboard and mouse so the simulation can be
+driven by a human, a script or a bot through the same code path.
+"""
+
+import math
+import pygame
+
+
+class InputState:
+    """Inputs applied to the player for a single simulation step"""
+
+    def __init__(self, up=False, down=False, left=False, right=False, aim_angle=None,
+                 shoot=False, dash=False, shield=False, burst=False,
+                 upgrade_damage=False, upgrade_speed=False, upgrade_hp=False):
+        # Held movement keys
+        self.up = up
+        self.down = down
+        self.left = left
+        self.right = right
+
+        # World-space angle from the player to the aim point (None keeps current angle)
+        self.aim_angle = aim_angle
+
+        # One-shot actions
+        self.shoot = shoot
+        self.dash = dash
+        self.shield = shield
+        self.burst = burst
+        self.upgrade_damage = upgrade_damage
+        self.upgrade_speed = upgrade_speed
+        self.upgrade_hp = upgrade_hp
+
+    @classmethod
+    def from_pygame(cls, player, camera=None):
+        """Read held movement keys and mouse aim from pygame"""
+        keys = pygame.key.get_pressed()
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+
+        # Convert screen mouse position to world position
+        if camera:
+            mouse_x += camera.render_x
+            mouse_y += camera.render_y
+
+        return cls(
+            up=keys[pygame.K_w],
+            down=keys[pygame.K_s],
+            left=keys[pygame.K_a],
+            right=keys[pygame.K_d],
+            aim_angle=math.atan2(mouse_y - player.pos.y, mouse_x - player.pos.x)
+        )
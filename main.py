@@ -1,10 +1,46 @@
 import sys
+import argparse
 from game import Game
+from replay import Replay
+from savestate import load_state_file
+from rng import check_seed
+
+
+def seed_arg(value):
+    """--seed value: an integer in the range save states and replays can store"""
+    try:
+        return check_seed(int(value))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='PVE Arena')
+    parser.add_argument('--telemetry', metavar='PATH',
+                        help='write a per-frame log (.csv, or .json/.jsonl for JSON Lines)')
+    parser.add_argument('--seed', type=seed_arg,
+                        help='session seed for reproducible runs, 0 to 2**64-1 (default: random)')
+    parser.add_argument('--record', metavar='PATH',
+                        help='record the inputs of each session to its own replay file '
+                             '(PATH-1, PATH-2, ... before the extension)')
+    parser.add_argument('--replay', metavar='PATH',
+                        help='play back a recorded replay instead of the menus')
+    parser.add_argument('--load-state', metavar='PATH',
+                        help='start from a save state instead of the main menu')
+    parser.add_argument('--replay-speed', type=float, default=1.0,
+                        help='replay speed multiplier (0 = as fast as possible)')
+    return parser.parse_args()
 
 
 def main():
-    game = Game()
-    game.run()
+    args = parse_args()
+    game = Game(telemetry_path=args.telemetry, seed=args.seed, record_path=args.record)
+    if args.replay:
+        game.run_replay(Replay.load(args.replay), args.replay_speed)
+    else:
+        if args.load_state:
+            load_state_file(game, args.load_state)
+        game.run()
     sys.exit()
 
 
@@ -1,12 +1,27 @@
 import pygame
 import math
-from config import MANA_RADIUS, MANA_COLLECTION_RADIUS, MANA_COLLECT_SPEED
+from entity import StoreField
+from config import MANA_RADIUS, MANA_COLLECTION_RADIUS, MANA_COLLECT_SPEED, MANA_PULSE_FRAMES
+
+
+# Pulse angular speed (radians per second)
+PULSE_SPEED = 5
 
 
 class ManaDrop(pygame.sprite.Sprite):
+    # Backed by the ManaStore arrays while attached to one
+    amount = StoreField()
+    spawn_time = StoreField()
+    pulse_time = StoreField()
+    being_collected = StoreField()
+
+    # Pre-rendered pulse animation shared by every drop, built on first use
+    _frames = None
+
     def __init__(self, x, y, amount=5):
         super().__init__()
         self.pos = pygame.math.Vector2(x, y)
+        self.prev_pos = self.pos.copy()
         self.amount = amount
         self.radius = MANA_RADIUS
         self.collection_radius = MANA_COLLECTION_RADIUS
@@ -20,11 +35,51 @@ class ManaDrop(pygame.sprite.Sprite):
         self.pulse_time = 0
 
         # Visual
-        self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+        self.image = self.get_frames()[0]
         self.rect = self.image.get_rect(center=(x, y))
         self.being_collected = False
 
+    @classmethod
+    def get_frames(cls):
+        """Pulse frame strip covering one period, converted to the display format"""
+        if cls._frames is None:
+            convert = pygame.display.get_surface() is not None
+            by_radius = {}
+            frames = []
+            for i in range(MANA_PULSE_FRAMES):
+                pulse = math.sin(2 * math.pi * i / MANA_PULSE_FRAMES) * 0.2 + 1.0
+                current_radius = int(MANA_RADIUS * pulse)
+                # Neighbouring phases often round to the same radius
+                if current_radius not in by_radius:
+                    image = cls._render_frame(current_radius)
+                    by_radius[current_radius] = image.convert_alpha() if convert else image
+                frames.append(by_radius[current_radius])
+            cls._frames = frames
+        return cls._frames
+
+    @staticmethod
+    def _render_frame(current_radius):
+        radius = MANA_RADIUS
+        image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+
+        # Outer glow
+        glow_color = (100, 200, 255, 100)
+        pygame.draw.circle(image, glow_color, (radius, radius), current_radius + 2)
+
+        # Core
+        core_color = (150, 230, 255)
+        pygame.draw.circle(image, core_color, (radius, radius), current_radius)
+        return image
+
+    def kill(self):
+        """Remove from all groups and detach from the mana store"""
+        store = self.__dict__.get('_store')
+        if store is not None:
+            store.remove(self)
+        super().kill()
+
     def update(self, dt, player_pos=None):
+        """Per-object update for drops outside a ManaStore"""
         self.pulse_time += dt
 
         # Drop animation
@@ -49,19 +104,10 @@ class ManaDrop(pygame.sprite.Sprite):
         self.rect.center = self.pos
 
     def draw(self, surface, camera):
-        # Pulsing effect
-        pulse = math.sin(self.pulse_time * 5) * 0.2 + 1.0
-        current_radius = int(self.radius * pulse)
-
-        # Redraw image with pulse
-        self.image.fill((0, 0, 0, 0))
-
-        # Outer glow
-        glow_color = (100, 200, 255, 100)
-        pygame.draw.circle(self.image, glow_color, (self.radius, self.radius), current_radius + 2)
-
-        # Core
-        core_color = (150, 230, 255)
-        pygame.draw.circle(self.image, core_color, (self.radius, self.radius), current_radius)
-
+        # Pulsing effect: pick the frame for the current phase
+        # (the mana store picks it for attached drops when it syncs)
+        if self.__dict__.get('_store') is None:
+            frames = self.get_frames()
+            phase = self.pulse_time * PULSE_SPEED / (2 * math.pi)
+            self.image = frames[int(phase * len(frames)) % len(frames)]
         surface.blit(self.image, camera.apply(self.rect))
@@ -0,0 +1,275 @@
+"""
+Array-backed mana drop store.
+Keeps mana drop positions and animation state in NumPy arrays (structure of
+arrays, like EnemyStore) so the drop animation, magnetism and pickup test for
+every drop run as one vectorized pass per step. Drop sprites stay attached to
+a slot and get their positions and pulse frames mirrored back once per step.
+"""
+
+import math
+import numpy as np
+from mana import ManaDrop, PULSE_SPEED
+
+
+class ManaStore:
+    """Structure-of-arrays storage and batch update for mana drops"""
+
+    # Per-drop values exposed to sprites through StoreField attributes
+    FIELDS = {
+        'amount': np.int64,
+        'spawn_time': np.float64,
+        'pulse_time': np.float64,
+        'being_collected': np.bool_,
+    }
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.capacity = 0
+        self.sprites = []
+        self.pending = []  # Added since the last batch operation, not in the arrays yet
+        self.added = 0  # Drops attached so far (age order)
+
+        # Motion parameters
+        self.pos = np.zeros((0, 2))
+        self.prev_pos = np.zeros((0, 2))  # Position at the previous sim step (render interpolation)
+        self.initial_y = np.zeros(0)
+        self.target_y = np.zeros(0)
+        self.spawn_duration = np.zeros(0)
+        self.collection_radius = np.zeros(0)
+        self.collect_speed = np.zeros(0)
+        self.order = np.zeros(0, dtype=np.int64)
+
+        # Sprite mirroring: pulse frame shown and whether the position changed
+        self.frame = np.zeros(0, dtype=np.int64)
+        self.dirty = np.zeros(0, dtype=np.bool_)
+        self.fields = {name: np.zeros(0, dtype=dtype) for name, dtype in self.FIELDS.items()}
+
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.count + len(self.pending)
+
+    def _arrays(self):
+        arrays = [self.pos, self.prev_pos, self.initial_y, self.target_y, self.spawn_duration,
+                  self.collection_radius, self.collect_speed, self.order, self.frame, self.dirty]
+        return arrays + list(self.fields.values())
+
+    def _grow(self, capacity):
+        """Reallocate all arrays with room for capacity drops"""
+        def grown(array):
+            new = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            new[:self.count] = array[:self.count]
+            return new
+
+        self.pos = grown(self.pos)
+        self.prev_pos = grown(self.prev_pos)
+        self.initial_y = grown(self.initial_y)
+        self.target_y = grown(self.target_y)
+        self.spawn_duration = grown(self.spawn_duration)
+        self.collection_radius = grown(self.collection_radius)
+        self.collect_speed = grown(self.collect_speed)
+        self.order = grown(self.order)
+        self.frame = grown(self.frame)
+        self.dirty = grown(self.dirty)
+        self.fields = {name: grown(array) for name, array in self.fields.items()}
+        self.capacity = capacity
+
+    def add(self, mana):
+        """
+        Queue a drop sprite; it is attached (its state copied into the arrays)
+        together with the other new drops by the next batch operation
+        """
+        self.pending.append(mana)
+
+    def _attach_pending(self):
+        """Copy every queued drop that is still alive into the arrays in one go"""
+        pending = [mana for mana in self.pending if mana.alive()]
+        self.pending = []
+        if not pending:
+            return
+        start = self.count
+        end = start + len(pending)
+        capacity = self.capacity
+        while capacity < end:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._grow(capacity)
+
+        self.pos[start:end] = [(mana.pos.x, mana.pos.y) for mana in pending]
+        self.prev_pos[start:end] = [(mana.prev_pos.x, mana.prev_pos.y) for mana in pending]
+        self.initial_y[start:end] = [mana.initial_y for mana in pending]
+        self.target_y[start:end] = [mana.target_y for mana in pending]
+        self.spawn_duration[start:end] = [mana.spawn_duration for mana in pending]
+        self.collection_radius[start:end] = [mana.collection_radius for mana in pending]
+        self.collect_speed[start:end] = [mana.collect_speed for mana in pending]
+        self.order[start:end] = np.arange(self.added, self.added + len(pending))
+        self.frame[start:end] = -1
+        self.dirty[start:end] = True
+        for name, array in self.fields.items():
+            array[start:end] = [mana.__dict__.get(name, 0) for mana in pending]
+
+        for slot, mana in enumerate(pending, start):
+            mana._store = self
+            mana._slot = slot
+        self.sprites.extend(pending)
+        self.count = end
+        self.added += len(pending)
+
+    def remove(self, mana):
+        """Detach a drop, writing its state back to the sprite"""
+        i = mana._slot
+        mana._store = None
+        mana.pos.update(self.pos[i])
+        mana.prev_pos.update(self.prev_pos[i])
+        for name, array in self.fields.items():
+            mana.__dict__[name] = array[i].item()
+
+        # Move the last drop into the freed slot
+        last = self.count - 1
+        if i != last:
+            for array in self._arrays():
+                array[i] = array[last]
+            moved = self.sprites[last]
+            self.sprites[i] = moved
+            moved._slot = i
+        self.sprites.pop()
+        self.count -= 1
+
+    def store_previous(self):
+        """Remember positions before a sim step for render interpolation"""
+        self.prev_pos[:self.count] = self.pos[:self.count]
+
+    def interpolate(self, slots, alpha):
+        """Positions of the given slots between the previous and current step, as [x, y] lists"""
+        prev = self.prev_pos[slots]
+        return (prev + (self.pos[slots] - prev) * alpha).tolist()
+
+    def update(self, dt, player_pos):
+        """Advance the drop animation and pull drops in range towards the player"""
+        self._attach_pending()
+        n = self.count
+        if n == 0:
+            return
+        self.fields['pulse_time'][:n] += dt
+
+        # Drop animation (ease out)
+        spawn_time = self.fields['spawn_time']
+        dropping = spawn_time[:n] < self.spawn_duration[:n]
+        if dropping.any():
+            idx = np.flatnonzero(dropping)
+            spawn_time[idx] += dt
+            progress = np.minimum(spawn_time[idx] / self.spawn_duration[idx], 1.0)
+            progress = 1 - (1 - progress) ** 3
+            initial_y = self.initial_y[idx]
+            self.pos[idx, 1] = initial_y + (self.target_y[idx] - initial_y) * progress
+            self.dirty[idx] = True
+
+        # Attraction to player (drops that had already landed at the start of the step)
+        delta = np.array((player_pos.x, player_pos.y)) - self.pos[:n]
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        pulled = ~dropping & (distance < self.collection_radius[:n]) & (distance > 0)
+        if not pulled.any():
+            return
+
+        idx = np.flatnonzero(pulled)
+        distance = distance[idx]
+        radius = self.collection_radius[idx]
+        self.fields['being_collected'][idx] = True
+        self.dirty[idx] = True
+        speed = self.collect_speed[idx] * (1 + (radius - distance) / radius)
+        self.pos[idx] += delta[idx] / distance[:, None] * (speed * dt)[:, None]
+
+    def collect(self, player_pos, pickup_radius):
+        """
+        Detach the drops within pickup_radius of the player and return them
+        with their summed amount
+        """
+        self._attach_pending()
+        n = self.count
+        delta = self.pos[:n] - (player_pos.x, player_pos.y)
+        hit = np.flatnonzero(np.hypot(delta[:, 0], delta[:, 1]) < pickup_radius)
+        total = int(self.fields['amount'][hit].sum())
+        return self._detach(hit), total
+
+    def _detach(self, idx):
+        """Detach the drops in slots idx (sorted) in one pass, writing their state back"""
+        if len(idx) == 0:
+            return []
+        slots = idx.tolist()
+        detached = [self.sprites[i] for i in slots]
+        positions = self.pos[idx].tolist()
+        previous = self.prev_pos[idx].tolist()
+        values = {name: array[idx].tolist() for name, array in self.fields.items()}
+        for j, mana in enumerate(detached):
+            mana._store = None
+            mana.pos.update(positions[j])
+            mana.prev_pos.update(previous[j])
+            for name, column in values.items():
+                mana.__dict__[name] = column[j]
+
+        # Fill the freed slots below the new count with the surviving drops above it
+        count = self.count - len(slots)
+        holes = idx[idx < count]
+        staying = np.ones(self.count - count, dtype=np.bool_)
+        staying[idx[idx >= count] - count] = False
+        movers = np.flatnonzero(staying) + count
+        for array in self._arrays():
+            array[holes] = array[movers]
+        for hole, mover in zip(holes.tolist(), movers.tolist()):
+            moved = self.sprites[mover]
+            self.sprites[hole] = moved
+            moved._slot = hole
+        del self.sprites[count:]
+        self.count = count
+        return detached
+
+    def settled(self):
+        """Landed drops not being pulled towards the player, oldest first"""
+        self._attach_pending()
+        n = self.count
+        settled = ((self.fields['spawn_time'][:n] >= self.spawn_duration[:n])
+                   & ~self.fields['being_collected'][:n])
+        idx = np.flatnonzero(settled)
+        return [self.sprites[i] for i in idx[np.argsort(self.order[idx])]]
+
+    def merge_oldest(self, count):
+        """
+        Merge the count oldest drops (settled ones first) into their nearest
+        remaining drop, which takes their amount. The merged drops are
+        detached and returned for the caller to remove.
+        """
+        self._attach_pending()
+        n = self.count
+        count = min(count, n - 1)
+        if count <= 0:
+            return []
+        settled = ((self.fields['spawn_time'][:n] >= self.spawn_duration[:n])
+                   & ~self.fields['being_collected'][:n])
+        rank = np.lexsort((self.order[:n], ~settled))
+        merged, kept = rank[:count], rank[count:]
+
+        delta = self.pos[merged, None, :] - self.pos[None, kept, :]
+        nearest = kept[np.argmin(np.einsum('ijk,ijk->ij', delta, delta), axis=1)]
+        amount = self.fields['amount']
+        np.add.at(amount, nearest, amount[merged])
+        return self._detach(np.sort(merged))
+
+    def sync(self):
+        """
+        Mirror moved positions and changed pulse frames back onto the sprites
+        (rects are placed when the drops are drawn)
+        """
+        self._attach_pending()
+        n = self.count
+        frames = ManaDrop.get_frames()
+        phase = self.fields['pulse_time'][:n] * (PULSE_SPEED / (2 * math.pi))
+        frame = (phase * len(frames)).astype(np.int64) % len(frames)
+        changed = np.flatnonzero(self.dirty[:n] | (frame != self.frame[:n]))
+        self.frame[:n] = frame
+        self.dirty[:n] = False
+
+        sprites = self.sprites
+        for i, xy, f in zip(changed.tolist(), self.pos[changed].tolist(), frame[changed].tolist()):
+            sprite = sprites[i]
+            sprite.pos.update(xy)
+            sprite.image = frames[f]
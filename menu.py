@@ -5,6 +5,7 @@ Handles main menu, pause menu, settings, and victory screen.
 
 import pygame
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, BG_COLOR, DIFFICULTY_SETTINGS
+from fonts import get_font
 
 
 class Button:
@@ -44,9 +45,9 @@ class MainMenu:
     """Main menu screen"""
 
     def __init__(self):
-        self.title_font = pygame.font.Font(None, 72)
-        self.button_font = pygame.font.Font(None, 48)
-        self.subtitle_font = pygame.font.Font(None, 32)
+        self.title_font = get_font(72)
+        self.button_font = get_font(48)
+        self.subtitle_font = get_font(32)
 
         button_width = 300
         button_height = 60
@@ -94,9 +95,9 @@ class DifficultyMenu:
     """Difficulty selection menu when starting a game"""
 
     def __init__(self):
-        self.title_font = pygame.font.Font(None, 64)
-        self.button_font = pygame.font.Font(None, 48)
-        self.info_font = pygame.font.Font(None, 28)
+        self.title_font = get_font(64)
+        self.button_font = get_font(48)
+        self.info_font = get_font(28)
 
         button_width = 300
         button_height = 60
@@ -155,9 +156,9 @@ class SettingsMenu:
     """Settings menu for game configuration"""
 
     def __init__(self):
-        self.title_font = pygame.font.Font(None, 64)
-        self.button_font = pygame.font.Font(None, 36)
-        self.label_font = pygame.font.Font(None, 32)
+        self.title_font = get_font(64)
+        self.button_font = get_font(36)
+        self.label_font = get_font(32)
 
         button_width = 300
         button_height = 60
@@ -215,8 +216,8 @@ class PauseMenu:
     """Pause menu overlay"""
 
     def __init__(self):
-        self.title_font = pygame.font.Font(None, 72)
-        self.button_font = pygame.font.Font(None, 48)
+        self.title_font = get_font(72)
+        self.button_font = get_font(48)
 
         button_width = 300
         button_height = 60
@@ -265,9 +266,9 @@ class VictoryScreen:
     """Victory screen when player wins"""
 
     def __init__(self, difficulty, waves_completed):
-        self.title_font = pygame.font.Font(None, 72)
-        self.button_font = pygame.font.Font(None, 48)
-        self.info_font = pygame.font.Font(None, 36)
+        self.title_font = get_font(72)
+        self.button_font = get_font(48)
+        self.info_font = get_font(36)
 
         self.difficulty = difficulty.upper()
         self.waves = waves_completed
@@ -323,9 +324,9 @@ class GameOverScreen:
     """Game over screen when player dies"""
 
     def __init__(self, waves_survived):
-        self.title_font = pygame.font.Font(None, 72)
-        self.button_font = pygame.font.Font(None, 48)
-        self.info_font = pygame.font.Font(None, 36)
+        self.title_font = get_font(72)
+        self.button_font = get_font(48)
+        self.info_font = get_font(36)
 
         self.waves = waves_survived
 
@@ -1,77 +1,133 @@
 """
 Particle system for visual effects.
+Particles live in NumPy arrays and are advanced in one vectorized step;
+drawing blits pre-rendered alpha stamps instead of rasterising every particle.
 """
 
-import pygame
-import random
 import math
+import numpy as np
+import pygame
+from config import (FPS, PARTICLE_MAX, PARTICLE_DAMPING, PARTICLE_GRAVITY,
+                    PARTICLE_ALPHA_LEVELS, PARTICLE_COLOR_STEP, PARTICLE_STAMP_CACHE_SIZE)
 
 
-class Particle(pygame.sprite.Sprite):
-    """Single particle"""
-
-    def __init__(self, x, y, color, velocity, lifetime=1.0):
-        super().__init__()
-        self.pos = pygame.math.Vector2(x, y)
-        self.vel = velocity
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = random.randint(2, 5)
-
-        self.image = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(center=(x, y))
-
-    def update(self, dt):
-        """Update particle"""
-        self.lifetime -= dt
-
-        if self.lifetime <= 0:
-            self.kill()
-            return
-
-        # Move
-        self.pos += self.vel * dt
-        self.vel *= 0.95  # Slow down
-
-        # Gravity
-        self.vel.y += 200 * dt
+class ParticleSystem:
+    """Array-backed particles with damping, gravity and fade-out"""
 
-        self.rect.center = self.pos
+    def __init__(self, max_particles=PARTICLE_MAX, rng=None):
+        self.max_particles = max_particles
+        self.count = 0
+        self.rng = rng if rng is not None else np.random.default_rng()  # Cosmetic stream
 
-    def draw(self, surface, camera):
-        """Draw particle with fade"""
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color = (*self.color, alpha)
+        self.pos = np.zeros((max_particles, 2))
+        self.prev_pos = np.zeros((max_particles, 2))
+        self.vel = np.zeros((max_particles, 2))
+        self.lifetime = np.zeros(max_particles)
+        self.max_lifetime = np.ones(max_particles)
+        self.size = np.zeros(max_particles, dtype=np.int32)
+        self.color = np.zeros((max_particles, 3), dtype=np.int32)
 
-        self.image.fill((0, 0, 0, 0))
-        pygame.draw.circle(self.image, color, (self.size, self.size), self.size)
+        # (r, g, b, size, alpha level) -> pre-rendered circle
+        self._stamps = {}
 
-        surface.blit(self.image, camera.apply(self.rect))
+    def __len__(self):
+        return self.count
 
+    def clear(self):
+        """Remove all particles"""
+        self.count = 0
 
-def create_death_particles(x, y, color, count=15):
-    """Create explosion of particles"""
-    particles = pygame.sprite.Group()
+    def emit(self, x, y, color, count=15):
+        """Create an explosion of particles at (x, y)"""
+        count = min(count, self.max_particles - self.count)
+        if count <= 0:
+            return
+        s = slice(self.count, self.count + count)
+        rng = self.rng
 
-    for _ in range(count):
         # Random direction and speed
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(100, 300)
-
-        velocity = pygame.math.Vector2(
-            math.cos(angle) * speed,
-            math.sin(angle) * speed
-        )
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(100, 300, count)
+        self.pos[s] = (x, y)
+        self.prev_pos[s] = (x, y)
+        self.vel[s, 0] = np.cos(angle) * speed
+        self.vel[s, 1] = np.sin(angle) * speed
+
+        lifetime = rng.uniform(0.5, 1.2, count)
+        self.lifetime[s] = lifetime
+        self.max_lifetime[s] = lifetime
+        self.size[s] = rng.integers(2, 6, count)
+
+        # Slight color variation, quantized so particles share stamps
+        jitter = rng.integers(-30, 31, (count, 3))
+        color = np.clip(np.asarray(color[:3]) + jitter, 0, 255)
+        step = PARTICLE_COLOR_STEP
+        self.color[s] = np.minimum((color + step // 2) // step * step, 255)
+
+        self.count += count
 
-        lifetime = random.uniform(0.5, 1.2)
-
-        # Slight color variation
-        r = max(0, min(255, color[0] + random.randint(-30, 30)))
-        g = max(0, min(255, color[1] + random.randint(-30, 30)))
-        b = max(0, min(255, color[2] + random.randint(-30, 30)))
-
-        particle = Particle(x, y, (r, g, b), velocity, lifetime)
-        particles.add(particle)
+    def update(self, dt):
+        """Advance all particles and drop the expired ones"""
+        n = self.count
+        if n == 0:
+            return
 
-    return particles
+        self.lifetime[:n] -= dt
+        alive = self.lifetime[:n] > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            n = len(keep)
+            for array in (self.pos, self.prev_pos, self.vel, self.lifetime,
+                          self.max_lifetime, self.size, self.color):
+                array[:n] = array[keep]
+            self.count = n
+
+        # Move, slow down, gravity
+        self.pos[:n] += self.vel[:n] * dt
+        self.vel[:n] *= PARTICLE_DAMPING ** (dt * FPS)
+        self.vel[:n, 1] += PARTICLE_GRAVITY * dt
+
+    def store_previous(self):
+        """Remember positions before a sim step for render interpolation"""
+        self.prev_pos[:self.count] = self.pos[:self.count]
+
+    def _get_stamp(self, key):
+        """Pre-rendered circle for (r, g, b, size, alpha level)"""
+        stamp = self._stamps.get(key)
+        if stamp is None:
+            if len(self._stamps) >= PARTICLE_STAMP_CACHE_SIZE:
+                self._stamps.clear()
+            r, g, b, size, level = key
+            alpha = 255 * level // (PARTICLE_ALPHA_LEVELS - 1)
+            stamp = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, (r, g, b, alpha), (size, size), size)
+            self._stamps[key] = stamp
+        return stamp
+
+    def draw(self, surface, camera, alpha=1.0):
+        """
+        Draw on-screen particles with fade (alpha interpolates between sim steps).
+        Returns the number of particles drawn.
+        """
+        n = self.count
+        if n == 0:
+            return 0
+
+        pos = self.prev_pos[:n] + (self.pos[:n] - self.prev_pos[:n]) * alpha
+        size = self.size[:n]
+        screen_x = (pos[:, 0] - camera.render_x - size).astype(np.int32)
+        screen_y = (pos[:, 1] - camera.render_y - size).astype(np.int32)
+
+        ratio = np.clip(self.lifetime[:n] / self.max_lifetime[:n], 0, 1)
+        level = (ratio * (PARTICLE_ALPHA_LEVELS - 1) + 0.5).astype(np.int32)
+
+        # Cull faded and off-screen particles
+        width, height = surface.get_size()
+        visible = ((level > 0) & (screen_x > -2 * size) & (screen_x < width) &
+                   (screen_y > -2 * size) & (screen_y < height))
+
+        get_stamp = self._get_stamp
+        keys = np.column_stack((self.color[:n], size, level))[visible].tolist()
+        coords = zip(screen_x[visible].tolist(), screen_y[visible].tolist())
+        surface.blits([(get_stamp(tuple(key)), xy) for key, xy in zip(keys, coords)], doreturn=False)
+        return len(keys)
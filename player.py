@@ -1,5 +1,6 @@
 import pygame
 from entity import Entity
+from inputs import InputState
 from config import (PLAYER_RADIUS, PLAYER_BASE_HP, PLAYER_ACCELERATION, PLAYER_FRICTION,
                     PLAYER_TURN_SPEED, PLAYER_BULLET_SPEED, PLAYER_BULLET_DAMAGE,
                     PLAYER_SHOOT_DELAY, UPGRADE_DAMAGE_BASE_COST, UPGRADE_DAMAGE_COST_INCREASE,
@@ -8,14 +9,16 @@ from config import (PLAYER_RADIUS, PLAYER_BASE_HP, PLAYER_ACCELERATION, PLAYER_F
                     UPGRADE_HP_INCREASE, UPGRADE_HP_HEAL,
                     ABILITY_DASH_COST, ABILITY_DASH_DISTANCE, ABILITY_DASH_COOLDOWN,
                     ABILITY_SHIELD_COST, ABILITY_SHIELD_DURATION, ABILITY_SHIELD_COOLDOWN,
-                    ABILITY_BURST_COST, ABILITY_BURST_DAMAGE, ABILITY_BURST_RADIUS, ABILITY_BURST_COOLDOWN)
+                    ABILITY_BURST_COST, ABILITY_BURST_DAMAGE, ABILITY_BURST_RADIUS, ABILITY_BURST_COOLDOWN,
+                    FPS)
 import math
 import random
 
 
 class Player(Entity):
-    def __init__(self, x, y, difficulty='normal'):
+    def __init__(self, x, y, difficulty='normal', rng=None):
         super().__init__(x, y, radius=PLAYER_RADIUS)
+        self.rng = rng if rng is not None else random  # Gameplay stream (shot spread)
         self.color = (100, 200, 255)
         self.acceleration = PLAYER_ACCELERATION
         self.friction = PLAYER_FRICTION
@@ -45,15 +48,22 @@ class Player(Entity):
         self.shield_time = 0
         self.burst_cooldown = 0
 
+        # Session stats
+        self.damage_taken = 0
+        self.mana_earned = 0
+
         self._draw_image()
 
     def _draw_image(self):
         self.image.fill((0, 0, 0, 0))
         pygame.draw.circle(self.image, self.color, (self.radius, self.radius), self.radius, width=4)
 
-    def update(self, dt, camera=None):
-        self._handle_input()
-        self._update_angle(camera)
+    def update(self, dt, camera=None, inputs=None):
+        if inputs is None:
+            inputs = InputState.from_pygame(self, camera)
+        ticks = dt * FPS
+        self._handle_input(inputs, ticks)
+        self._update_angle(inputs.aim_angle, ticks)
         super().update(dt)
 
         # Update cooldowns
@@ -72,32 +82,24 @@ class Player(Entity):
             if self.shield_time <= 0:
                 self.shield_active = False
 
-    def _handle_input(self):
-        keys = pygame.key.get_pressed()
-
-        if keys[pygame.K_w]: self.vel.y -= self.acceleration
-        if keys[pygame.K_s]: self.vel.y += self.acceleration
-        if keys[pygame.K_a]: self.vel.x -= self.acceleration
-        if keys[pygame.K_d]: self.vel.x += self.acceleration
-
-    def _update_angle(self, camera=None):
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+    def _handle_input(self, inputs, ticks=1.0):
+        acceleration = self.acceleration * ticks
+        if inputs.up: self.vel.y -= acceleration
+        if inputs.down: self.vel.y += acceleration
+        if inputs.left: self.vel.x -= acceleration
+        if inputs.right: self.vel.x += acceleration
 
-        # Convert screen mouse position to world position
-        if camera:
-            world_mouse_x = mouse_x + camera.x
-            world_mouse_y = mouse_y + camera.y
-        else:
-            world_mouse_x = mouse_x
-            world_mouse_y = mouse_y
+    def _update_angle(self, target_angle=None, ticks=1.0):
+        if target_angle is None:
+            return
 
-        target_angle = math.atan2(world_mouse_y - self.pos.y, world_mouse_x - self.pos.x)
+        turn_speed = self.turn_speed * ticks
         angle_diff = (target_angle - self.angle + math.pi) % (2 * math.pi) - math.pi
 
-        if angle_diff < -self.turn_speed:
-            self.angle -= self.turn_speed
-        elif angle_diff > self.turn_speed:
-            self.angle += self.turn_speed
+        if angle_diff < -turn_speed:
+            self.angle -= turn_speed
+        elif angle_diff > turn_speed:
+            self.angle += turn_speed
         else:
             self.angle = target_angle
 
@@ -107,8 +109,8 @@ class Player(Entity):
             self.shoot_cooldown = self.shoot_delay
 
             # Add randomness to angle and speed
-            angle_variance = random.uniform(-0.1, 0.1)  # +/- ~6 degrees
-            speed_variance = random.uniform(0.9, 1.1)
+            angle_variance = self.rng.uniform(-0.1, 0.1)  # +/- ~6 degrees
+            speed_variance = self.rng.uniform(0.9, 1.1)
 
             bullet_angle = self.angle + angle_variance
             bullet_speed = self.bullet_speed * speed_variance
@@ -118,8 +120,8 @@ class Player(Entity):
             spawn_x = self.pos.x + math.cos(self.angle) * spawn_distance
             spawn_y = self.pos.y + math.sin(self.angle) * spawn_distance
 
-            from bullet import Bullet
-            return Bullet(spawn_x, spawn_y, bullet_angle, bullet_speed, self.bullet_damage, owner_type='player')
+            from bullet import bullet_pool
+            return bullet_pool.acquire(spawn_x, spawn_y, bullet_angle, bullet_speed, self.bullet_damage, owner_type='player')
         return None
 
     def draw(self, surface, camera):
@@ -129,7 +131,7 @@ class Player(Entity):
             pulse = abs(math.sin(self.shield_time * 5)) * 5
             current_radius = shield_radius + pulse
 
-            screen_pos = camera.apply_pos(self.pos.x, self.pos.y)
+            screen_pos = camera.apply_pos(*self.rect.center)
 
             # Outer glow
             alpha = int(100 * (self.shield_time / ABILITY_SHIELD_DURATION))
@@ -143,10 +145,11 @@ class Player(Entity):
 
         # Draw the direction line
         line_length = self.radius + 15
-        end_x = self.pos.x + math.cos(self.angle) * line_length
-        end_y = self.pos.y + math.sin(self.angle) * line_length
+        center_x, center_y = self.rect.center
+        end_x = center_x + math.cos(self.angle) * line_length
+        end_y = center_y + math.sin(self.angle) * line_length
 
-        start_pos = camera.apply_pos(self.pos.x, self.pos.y)
+        start_pos = camera.apply_pos(center_x, center_y)
         end_pos = camera.apply_pos(end_x, end_y)
 
         pygame.draw.line(surface, (255, 255, 255), start_pos, end_pos, 4)
@@ -155,12 +158,14 @@ class Player(Entity):
         # Shield blocks damage
         if self.shield_active:
             return
+        self.damage_taken += min(damage, self.hp)
         self.hp -= damage
         if self.hp < 0:
             self.hp = 0
 
     def collect_mana(self, amount):
         self.mana += amount
+        self.mana_earned += amount
 
     # Abilities
     def use_dash(self):
@@ -0,0 +1,109 @@
+"""
+Per-subsystem frame profiler.
+Accumulates wall time per named section during a frame and keeps a rolling
+window of per-frame timings for averages and p99, shown in an overlay or
+read through get_stats().
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from config import PROFILER_WINDOW
+from hud import build_panel
+
+
+class FrameProfiler:
+    """Rolling per-section frame timings"""
+
+    def __init__(self, window=PROFILER_WINDOW):
+        self.window = window
+        self.enabled = True
+        self.show_overlay = False
+        self.frame_count = 0
+        self.history = {}  # section -> deque of per-frame ms
+        self._current = {}  # section -> ms so far this frame
+        self._panel = None
+
+    @contextmanager
+    def section(self, name):
+        """Time the enclosed block under name (accumulates within a frame)"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000.0)
+
+    def add(self, name, ms):
+        """Add ms to a section for the current frame"""
+        self._current[name] = self._current.get(name, 0.0) + ms
+
+    def end_frame(self):
+        """Close the current frame and push its timings into the history"""
+        if not self.enabled:
+            return
+        current = self._current
+        for name in current:
+            if name not in self.history:
+                self.history[name] = deque(maxlen=self.window)
+        # Sections that did not run this frame count as 0 ms
+        for name, samples in self.history.items():
+            samples.append(current.get(name, 0.0))
+        self._current = {}
+        self.frame_count += 1
+
+    def reset(self):
+        self.history.clear()
+        self._current = {}
+        self.frame_count = 0
+
+    def get_stats(self):
+        """Return {section: {'avg', 'p99', 'max', 'last'}} in milliseconds"""
+        stats = {}
+        for name, samples in self.history.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            p99_index = min(len(ordered) - 1, int(len(ordered) * 0.99))
+            stats[name] = {
+                'avg': sum(ordered) / len(ordered),
+                'p99': ordered[p99_index],
+                'max': ordered[-1],
+                'last': samples[-1]
+            }
+        return stats
+
+    def draw(self, surface, font, text_cache):
+        """Draw the timing overlay in the top-right corner"""
+        stats = self.get_stats()
+        line_height = 20
+        width = 330
+        height = line_height * (len(stats) + 1) + 10
+        if self._panel is None or self._panel.get_height() != height:
+            self._panel = build_panel(width, height, (0, 0, 0, 170), (100, 200, 255, 80), 1, 6)
+
+        x = surface.get_width() - width - 10
+        y = 10
+        surface.blit(self._panel, (x, y))
+
+        columns = (('section', x + 8, None), ('avg ms', x + 240, 'avg'), ('p99 ms', x + 320, 'p99'))
+        for label, column_x, key in columns:
+            header = text_cache.render(font, label, (150, 200, 255))
+            self._blit_column(surface, header, column_x, y + 5, right=key is not None)
+
+        for i, (name, values) in enumerate(stats.items(), start=1):
+            row_y = y + 5 + i * line_height
+            label = text_cache.render(font, name, (220, 220, 220))
+            surface.blit(label, (x + 8, row_y))
+            for _, column_x, key in columns[1:]:
+                # Values change every frame, so render directly instead of filling the cache
+                value = font.render(f'{values[key]:.2f}', True, (220, 220, 220))
+                self._blit_column(surface, value, column_x, row_y, right=True)
+
+    @staticmethod
+    def _blit_column(surface, text, x, y, right=False):
+        if right:
+            x -= text.get_width()
+        surface.blit(text, (x, y))
@@ -0,0 +1,145 @@
+"""
+Input recording and replay.
+A replay is a small header (seed, difficulty, sim rate) and an optional
+save state checkpoint (for sessions restored from one) followed by one
+fixed-size record per simulation tick: a bit mask of held keys and one-shot
+actions plus the world-space aim angle. Replaying the same ticks against the
+same seed, or from the same checkpoint, reproduces the session exactly.
+"""
+
+import math
+import os
+import struct
+from inputs import InputState
+
+
+REPLAY_MAGIC = b'PVER'
+REPLAY_VERSION = 2
+
+# magic, version, seed, difficulty, sim rate
+HEADER = struct.Struct('<4sHQ8sH')
+# checkpoint size in bytes (0 = session starts from scratch)
+CHECKPOINT = struct.Struct('<I')
+# flags, aim angle (NaN = keep current angle)
+TICK = struct.Struct('<Hf')
+
+# Bit order of the InputState flags in a tick record
+INPUT_FLAGS = ('up', 'down', 'left', 'right', 'shoot', 'dash', 'shield', 'burst',
+               'upgrade_damage', 'upgrade_speed', 'upgrade_hp')
+
+
+def encode_tick(inputs):
+    flags = 0
+    for bit, name in enumerate(INPUT_FLAGS):
+        if getattr(inputs, name):
+            flags |= 1 << bit
+    aim = math.nan if inputs.aim_angle is None else inputs.aim_angle
+    return TICK.pack(flags, aim)
+
+
+def decode_tick(flags, aim):
+    inputs = InputState(aim_angle=None if math.isnan(aim) else aim)
+    for bit, name in enumerate(INPUT_FLAGS):
+        if flags & (1 << bit):
+            setattr(inputs, name, True)
+    return inputs
+
+
+class Replay:
+    """
+    A recorded session: header fields, the save state it started from (None
+    for a new game) plus one InputState per tick
+    """
+
+    def __init__(self, seed, difficulty, sim_rate, ticks=None, checkpoint=None):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.sim_rate = sim_rate
+        self.ticks = ticks if ticks is not None else []
+        self.checkpoint = checkpoint
+
+    def __len__(self):
+        return len(self.ticks)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        return cls.from_bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < HEADER.size + CHECKPOINT.size:
+            raise ValueError('Replay file is truncated')
+        magic, version, seed, difficulty, sim_rate = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError('Not a replay file')
+        if version != REPLAY_VERSION:
+            raise ValueError(f'Unsupported replay version {version}')
+
+        size, = CHECKPOINT.unpack_from(data, HEADER.size)
+        start = HEADER.size + CHECKPOINT.size
+        if len(data) < start + size:
+            raise ValueError('Replay file is truncated')
+        checkpoint = bytes(data[start:start + size]) if size else None
+
+        body = memoryview(data)[start + size:]
+        body = body[:len(body) - len(body) % TICK.size]
+        ticks = [decode_tick(flags, aim) for flags, aim in TICK.iter_unpack(body)]
+        return cls(seed, difficulty.rstrip(b'\0').decode('ascii'), sim_rate, ticks, checkpoint)
+
+
+class ReplayRecorder:
+    """
+    Buffers per-tick inputs in memory and writes them out in one go.
+    Each session gets its own file: path with the session number added
+    before the extension (session.pve -> session-1.pve, session-2.pve, ...).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.session = 0
+        self.header = None
+        self.checkpoint = None
+        self.data = bytearray()
+
+    def __len__(self):
+        return len(self.data) // TICK.size
+
+    def session_path(self):
+        """File the current session is written to"""
+        root, ext = os.path.splitext(self.path)
+        return f'{root}-{self.session}{ext}'
+
+    def start(self, seed, difficulty, sim_rate):
+        """Save the previous session's recording and begin a new one"""
+        self.save()
+        self.session += 1
+        self.header = HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed,
+                                  difficulty.encode('ascii'), sim_rate)
+        self.checkpoint = None
+        self.data = bytearray()
+
+    def set_checkpoint(self, state):
+        """Record the current session as starting from save_state() bytes"""
+        self.checkpoint = state
+
+    def record(self, inputs):
+        """
+        Append one tick. The aim angle is rounded to its stored precision in
+        place, so the live session simulates exactly what will be replayed.
+        """
+        tick = encode_tick(inputs)
+        if inputs.aim_angle is not None:
+            inputs.aim_angle = TICK.unpack(tick)[1]
+        self.data += tick
+
+    def save(self):
+        if self.header is None:
+            return
+        with open(self.session_path(), 'wb') as f:
+            f.write(self.header)
+            checkpoint = self.checkpoint or b''
+            f.write(CHECKPOINT.pack(len(checkpoint)))
+            f.write(checkpoint)
+            f.write(self.data)
@@ -0,0 +1,41 @@
+"""
+Per-session random number service.
+Gameplay randomness (spawns, enemy stats, shot spread, drops) and cosmetic
+randomness (particles) come from separate streams seeded from one session
+seed, so effects can change without changing how a seeded run plays out.
+"""
+
+import random
+import numpy as np
+
+
+# Seeds are stored as unsigned 64-bit integers (save states, replays)
+MAX_SEED = 2 ** 64 - 1
+
+
+def check_seed(seed):
+    """Return seed, raising ValueError if it is outside 0..MAX_SEED"""
+    if not 0 <= seed <= MAX_SEED:
+        raise ValueError(f'Seed must be between 0 and {MAX_SEED}, got {seed}')
+    return seed
+
+
+class SessionRNG:
+    """Seeded gameplay and cosmetic random streams for one session"""
+
+    def __init__(self, seed=None):
+        # Pick a seed anyway so an unseeded session can still be reproduced
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = check_seed(seed)
+        self.gameplay = random.Random(seed)
+        self.cosmetic = np.random.default_rng([seed, 1])
+
+    def get_state(self):
+        """Snapshot of both streams"""
+        return self.gameplay.getstate(), self.cosmetic.bit_generator.state
+
+    def set_state(self, state):
+        gameplay_state, cosmetic_state = state
+        self.gameplay.setstate(gameplay_state)
+        self.cosmetic.bit_generator.state = cosmetic_state
@@ -0,0 +1,277 @@
+"""
+Binary save states.
+Serializes a running session (player, enemies, bullets, mana drops, wave
+progress and spawn queue, transition timer and RNG streams) into a zlib-compressed struct
+stream, so a session can be restored at any wave in milliseconds.
+Particles are cosmetic and are not saved.
+"""
+
+import random
+import struct
+import zlib
+from collections import deque
+from bullet import bullet_pool
+from enemy_types import create_enemy
+from mana import ManaDrop
+
+
+STATE_MAGIC = b'PVES'
+STATE_VERSION = 4
+
+# magic, version, seed, difficulty, sim rate, wave transition, wave timer
+HEADER = struct.Struct('<4sHQ8sH?d')
+COUNT = struct.Struct('<I')
+# current wave, enemies remaining, wave active, trickle spawn timer
+WAVE = struct.Struct('<ii?d')
+# queued enemy type index
+SPAWN = struct.Struct('<B')
+# next wave planned during the transition
+PLANNED = struct.Struct('<?')
+CAMERA = struct.Struct('<dd')
+
+ENEMY_TYPE_NAMES = ('shooter', 'exploder', 'bouncer', 'tank')
+
+# (attribute, struct code); 'pos' and 'vel' expand to two doubles
+PLAYER_FIELDS = (
+    ('pos', 'dd'), ('vel', 'dd'), ('angle', 'd'),
+    ('hp', 'i'), ('max_hp', 'i'), ('mana', 'i'),
+    ('shoot_cooldown', 'd'), ('bullet_damage', 'i'), ('bullet_speed', 'd'),
+    ('damage_level', 'i'), ('speed_level', 'i'), ('hp_level', 'i'),
+    ('dash_cooldown', 'd'), ('shield_cooldown', 'd'), ('shield_active', '?'),
+    ('shield_time', 'd'), ('burst_cooldown', 'd'), ('damage_taken', 'i'), ('mana_earned', 'i'),
+)
+ENEMY_FIELDS = (
+    ('pos', 'dd'), ('vel', 'dd'), ('radius', 'd'), ('hp', 'd'), ('max_hp', 'i'),
+    ('shoot_cooldown', 'd'), ('bullet_speed', 'd'), ('speed', 'd'),
+    ('last_bounce_time', 'd'), ('is_exploding', '?'), ('explosion_time', 'd'),
+)
+BULLET_FIELDS = (('pos', 'dd'), ('angle', 'd'), ('speed', 'd'), ('damage', 'i'))
+MANA_FIELDS = (
+    ('pos', 'dd'), ('amount', 'i'), ('spawn_time', 'd'), ('initial_y', 'd'),
+    ('target_y', 'd'), ('pulse_time', 'd'), ('being_collected', '?'),
+)
+
+PLAYER = struct.Struct('<' + ''.join(code for _, code in PLAYER_FIELDS))
+# type index, store slot (-1 = not in the store), fields
+ENEMY = struct.Struct('<Bi' + ''.join(code for _, code in ENEMY_FIELDS))
+# owner (0 = player, 1 = enemy), fields
+BULLET = struct.Struct('<B' + ''.join(code for _, code in BULLET_FIELDS))
+MANA = struct.Struct('<' + ''.join(code for _, code in MANA_FIELDS))
+
+# Mersenne Twister state (624 words + position), gauss flag and value
+GAMEPLAY_RNG = struct.Struct('<625I?d')
+# PCG64 state and increment (128-bit each), has_uint32, uinteger
+COSMETIC_RNG = struct.Struct('<16s16s?I')
+
+
+def _values(obj, fields, overrides=None):
+    """Flatten obj's fields into a tuple for packing"""
+    values = []
+    for name, code in fields:
+        value = overrides[name] if overrides and name in overrides else getattr(obj, name, 0)
+        if code == 'dd':
+            values.extend((value[0], value[1]))
+        else:
+            values.append(value)
+    return values
+
+
+def _apply(obj, fields, values):
+    """Set obj's fields from an unpacked tuple (skipping ones obj doesn't have)"""
+    i = 0
+    for name, code in fields:
+        if code == 'dd':
+            getattr(obj, name).update(values[i], values[i + 1])
+            i += 2
+        else:
+            if hasattr(obj, name):
+                setattr(obj, name, values[i])
+            i += 1
+
+
+def _pack_group(out, record, items):
+    out.append(COUNT.pack(len(items)))
+    out.extend(record.pack(*item) for item in items)
+
+
+def _pack_rng(rng):
+    version, words, gauss = rng.gameplay.getstate()
+    gameplay = GAMEPLAY_RNG.pack(*words, gauss is not None, gauss or 0.0)
+
+    state = rng.cosmetic.bit_generator.state
+    cosmetic = COSMETIC_RNG.pack(
+        state['state']['state'].to_bytes(16, 'little'),
+        state['state']['inc'].to_bytes(16, 'little'),
+        bool(state['has_uint32']), state['uinteger']
+    )
+    return gameplay + cosmetic
+
+
+def _unpack_rng(rng, data, offset):
+    values = GAMEPLAY_RNG.unpack_from(data, offset)
+    offset += GAMEPLAY_RNG.size
+    gauss = values[626] if values[625] else None
+    rng.gameplay.setstate((3, tuple(values[:625]), gauss))
+
+    state, inc, has_uint32, uinteger = COSMETIC_RNG.unpack_from(data, offset)
+    offset += COSMETIC_RNG.size
+    rng.cosmetic.bit_generator.state = {
+        'bit_generator': 'PCG64',
+        'state': {'state': int.from_bytes(state, 'little'), 'inc': int.from_bytes(inc, 'little')},
+        'has_uint32': int(has_uint32),
+        'uinteger': uinteger
+    }
+    return offset
+
+
+def _enemy_record(enemy):
+    store = enemy.__dict__.get('_store')
+    overrides = None
+    slot = -1
+    if store is not None:
+        # Attached enemies keep their live position and velocity in the store
+        slot = enemy._slot
+        overrides = {'pos': store.pos[slot], 'vel': store.vel[slot]}
+    return (ENEMY_TYPE_NAMES.index(enemy.enemy_type), slot, *_values(enemy, ENEMY_FIELDS, overrides))
+
+
+def save_state(game):
+    """Serialize the current session to compressed bytes"""
+    out = [
+        HEADER.pack(STATE_MAGIC, STATE_VERSION, game.rng.seed, game.difficulty.encode('ascii'),
+                    game.sim_rate, game.wave_transition, game.wave_timer),
+        WAVE.pack(game.wave_manager.current_wave, game.wave_manager.enemies_remaining,
+                  game.wave_manager.wave_active, game.wave_manager.spawn_timer),
+        CAMERA.pack(game.camera.x, game.camera.y),
+        _pack_rng(game.rng),
+        PLAYER.pack(*_values(game.player, PLAYER_FIELDS)),
+    ]
+    _pack_group(out, SPAWN, [(ENEMY_TYPE_NAMES.index(enemy_type),)
+                             for enemy_type in game.wave_manager.spawn_queue])
+
+    # Next wave: types not built yet and the enemies built so far
+    next_wave_types = game.wave_manager.next_wave_types
+    out.append(PLANNED.pack(next_wave_types is not None))
+    _pack_group(out, SPAWN, [(ENEMY_TYPE_NAMES.index(enemy_type),)
+                             for enemy_type in next_wave_types or ()])
+    _pack_group(out, ENEMY, [_enemy_record(enemy) for enemy in game.prebuilt_enemies])
+    _pack_group(out, ENEMY, [_enemy_record(enemy) for enemy in game.enemies])
+    _pack_group(out, BULLET, [
+        (0 if bullet.owner_type == 'player' else 1, *_values(bullet, BULLET_FIELDS))
+        for bullet in (*game.player_bullets, *game.enemy_bullets)
+    ])
+    _pack_group(out, MANA, [_values(mana, MANA_FIELDS) for mana in game.mana_drops])
+    return zlib.compress(b''.join(out))
+
+
+def _unpack_group(record, data, offset):
+    count, = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+    items = [record.unpack_from(data, offset + i * record.size) for i in range(count)]
+    return items, offset + count * record.size
+
+
+def _set_radius(enemy, radius):
+    """Swap an enemy's image for its restored radius"""
+    enemy.radius = radius
+    enemy.image = enemy.get_image(enemy.enemy_type, radius)
+    enemy.rect = enemy.image.get_rect(center=enemy.pos)
+
+
+def _restore_enemy(game, record, multipliers):
+    """Rebuild an enemy from its record, returning (store slot, enemy)"""
+    type_index, slot, *values = record
+    # Built with a throwaway RNG; every random attribute is restored from the record
+    enemy = create_enemy(ENEMY_TYPE_NAMES[type_index], 0, 0, multipliers, random.Random(0))
+    enemy.rng = game.rng.gameplay
+    _apply(enemy, ENEMY_FIELDS, values)
+    enemy.prev_pos.update(enemy.pos)
+    _set_radius(enemy, enemy.radius)
+    return slot, enemy
+
+
+def load_state(game, data):
+    """Replace the game's session with one restored from save_state() bytes"""
+    state = data
+    data = zlib.decompress(data)
+    magic, version, seed, difficulty, sim_rate, wave_transition, wave_timer = HEADER.unpack_from(data)
+    if magic != STATE_MAGIC:
+        raise ValueError('Not a save state')
+    if version != STATE_VERSION:
+        raise ValueError(f'Unsupported save state version {version}')
+    offset = HEADER.size
+
+    game.set_sim_rate(sim_rate)
+    game.start_new_game(difficulty.rstrip(b'\0').decode('ascii'), seed=seed)
+    game.wave_transition = wave_transition
+    game.wave_timer = wave_timer
+
+    wave_manager = game.wave_manager
+    (wave_manager.current_wave, wave_manager.enemies_remaining,
+     wave_manager.wave_active, wave_manager.spawn_timer) = WAVE.unpack_from(data, offset)
+    offset += WAVE.size
+    game.camera.x, game.camera.y = CAMERA.unpack_from(data, offset)
+    game.camera.render_x, game.camera.render_y = game.camera.x, game.camera.y
+    game.camera.store_previous()
+    offset += CAMERA.size
+
+    offset = _unpack_rng(game.rng, data, offset)
+
+    _apply(game.player, PLAYER_FIELDS, PLAYER.unpack_from(data, offset))
+    game.player.prev_pos.update(game.player.pos)
+    game.player.rect.center = game.player.pos
+    offset += PLAYER.size
+
+    queued, offset = _unpack_group(SPAWN, data, offset)
+    wave_manager.spawn_queue.extend(ENEMY_TYPE_NAMES[type_index] for type_index, in queued)
+
+    planned, = PLANNED.unpack_from(data, offset)
+    offset += PLANNED.size
+    next_wave_types, offset = _unpack_group(SPAWN, data, offset)
+    if planned:
+        wave_manager.next_wave_types = deque(ENEMY_TYPE_NAMES[type_index] for type_index, in next_wave_types)
+    prebuilt, offset = _unpack_group(ENEMY, data, offset)
+    multipliers = wave_manager.get_difficulty_multipliers()
+    game.prebuilt_enemies = [_restore_enemy(game, record, multipliers)[1] for record in prebuilt]
+
+    enemies, offset = _unpack_group(ENEMY, data, offset)
+    restored = [_restore_enemy(game, record, multipliers) for record in enemies]
+
+    # Re-attach store enemies in their original slot order so updates and
+    # shots happen in the same order as before saving
+    for slot, enemy in sorted((item for item in restored if item[0] >= 0), key=lambda item: item[0]):
+        game.enemy_store.add(enemy)
+    for slot, enemy in restored:
+        if slot < 0:
+            game.custom_enemies.add(enemy)
+        game.enemies.add(enemy)
+        game.all_sprites.add(enemy)
+
+    bullets, offset = _unpack_group(BULLET, data, offset)
+    for owner, x, y, angle, speed, damage in bullets:
+        owner_type = 'player' if owner == 0 else 'enemy'
+        bullet = bullet_pool.acquire(x, y, angle, speed, damage, owner_type)
+        (game.player_bullets if owner == 0 else game.enemy_bullets).add(bullet)
+        game.all_sprites.add(bullet)
+
+    drops, offset = _unpack_group(MANA, data, offset)
+    for values in drops:
+        mana = ManaDrop(0, 0)
+        _apply(mana, MANA_FIELDS, values)
+        mana.prev_pos.update(mana.pos)
+        mana.rect.center = mana.pos
+        game._add_mana(mana)
+
+    # The new session's recording replays from this state, not from its seed
+    if game.recorder is not None:
+        game.recorder.set_checkpoint(state)
+
+
+def save_state_file(game, path):
+    with open(path, 'wb') as f:
+        f.write(save_state(game))
+
+
+def load_state_file(game, path):
+    with open(path, 'rb') as f:
+        load_state(game, f.read())
@@ -0,0 +1,99 @@
+"""
+Uniform spatial hash for broad-phase collision queries.
+Objects are bucketed by the cell containing their centre; queries widen their
+search by the largest inserted radius, so every overlapping object is found
+and each one is returned at most once.
+"""
+
+
+class SpatialHash:
+    """Uniform grid mapping cells to the objects whose centre lies inside"""
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.max_radius = 0
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.cells.values())
+
+    def clear(self):
+        """Remove all objects"""
+        self.cells.clear()
+        self.max_radius = 0
+
+    def insert(self, obj):
+        """Add an object with pos and radius attributes"""
+        key = (int(obj.pos.x // self.cell_size), int(obj.pos.y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [obj]
+        else:
+            bucket.append(obj)
+        if obj.radius > self.max_radius:
+            self.max_radius = obj.radius
+
+    def rebuild(self, objects):
+        """Clear and re-insert all objects (call once per step after they move)"""
+        self.clear()
+        cells = self.cells
+        size = self.cell_size
+        max_radius = 0
+        for obj in objects:
+            pos = obj.pos
+            key = (int(pos.x // size), int(pos.y // size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [obj]
+            else:
+                bucket.append(obj)
+            if obj.radius > max_radius:
+                max_radius = obj.radius
+        self.max_radius = max_radius
+
+    def rebuild_points(self, objects, points, radii):
+        """rebuild() from positions (N x 2) and radii already gathered in arrays"""
+        self.clear()
+        if not objects:
+            return
+        cells = self.cells
+        for key, obj in zip(map(tuple, (points // self.cell_size).astype(int).tolist()), objects):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [obj]
+            else:
+                bucket.append(obj)
+        self.max_radius = radii.max().item()
+
+    def query(self, x, y, radius=0):
+        """Return candidate objects that may overlap the circle at (x, y)"""
+        reach = radius + self.max_radius
+        return self.query_rect(x - reach, y - reach, x + reach, y + reach, pad=False)
+
+    def query_rect(self, left, top, right, bottom, pad=True):
+        """Return candidate objects that may overlap the given world rectangle"""
+        if pad:
+            left -= self.max_radius
+            top -= self.max_radius
+            right += self.max_radius
+            bottom += self.max_radius
+
+        size = self.cell_size
+        x0, x1 = int(left // size), int(right // size)
+        y0, y1 = int(top // size), int(bottom // size)
+
+        cells = self.cells
+        found = []
+        # Sparse grids: walking the occupied cells beats scanning a huge range
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            for (cx, cy), bucket in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    found.extend(bucket)
+            return found
+
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
@@ -0,0 +1,65 @@
+"""
+Per-session frame telemetry.
+Frames are buffered in memory and written in bulk at wave boundaries, as CSV
+or JSON Lines (chosen by file extension), so logging never hits the disk
+mid-wave. Every row carries its session number; frame indices restart at 0
+with each session.
+"""
+
+import csv
+import json
+
+
+FRAME_FIELDS = ('session', 'frame', 'frame_ms', 'wave', 'enemies', 'player_bullets',
+                'enemy_bullets', 'mana_drops', 'particles')
+
+
+class FrameLog:
+    """Buffered per-frame log of frame time and entity counts"""
+
+    def __init__(self, path, fmt=None):
+        self.path = path
+        if fmt is None:
+            fmt = 'jsonl' if path.endswith(('.json', '.jsonl')) else 'csv'
+        self.format = fmt
+        self.rows = []
+        self.session = 0
+        self.frame_index = 0
+        self._started = False
+
+    def __len__(self):
+        return self.frame_index
+
+    def start_session(self):
+        """Write out the previous session's frames and start numbering afresh"""
+        self.flush()
+        self.session += 1
+        self.frame_index = 0
+
+    def record(self, frame_ms, wave, enemies, player_bullets, enemy_bullets, mana_drops, particles):
+        """Buffer one frame (no I/O)"""
+        self.rows.append((self.session, self.frame_index, round(frame_ms, 3), wave, enemies,
+                          player_bullets, enemy_bullets, mana_drops, particles))
+        self.frame_index += 1
+
+    def flush(self):
+        """Write all buffered frames in one go"""
+        if not self.rows:
+            return
+
+        # Truncate on the first write of the session, append afterwards
+        mode = 'a' if self._started else 'w'
+        with open(self.path, mode, newline='') as f:
+            if self.format == 'csv':
+                writer = csv.writer(f)
+                if not self._started:
+                    writer.writerow(FRAME_FIELDS)
+                writer.writerows(self.rows)
+            else:
+                f.write(''.join(json.dumps(dict(zip(FRAME_FIELDS, row))) + '\n' for row in self.rows))
+
+        self.rows.clear()
+        self._started = True
+
+    def close(self):
+        self.flush()
@@ -0,0 +1,29 @@
+import os
+import sys
+
+# Headless, quiet pygame before any game module is imported
+os.environ.setdefault('PVE_HEADLESS', '1')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from game import Game
+
+
+@pytest.fixture
+def new_game():
+    """Factory for headless games with the profiler off (keyword arguments go to Game)"""
+    def new_game(seed=3, **kwargs):
+        game = Game(headless=True, seed=seed, **kwargs)
+        game.profiler.enabled = False
+        return game
+    return new_game
+
+
+@pytest.fixture
+def game(new_game):
+    """Headless game with a 'normal' session started"""
+    game = new_game()
+    game.start_new_game('normal')
+    return game
@@ -0,0 +1,59 @@
+from bullet import Bullet, bullet_pool
+
+
+def fire_through(game, start, end):
+    """A player bullet that moved from start to end this step"""
+    bullet = bullet_pool.acquire(*start, 0.0, 0.0, 1, 'player')
+    bullet.pos.update(end)
+    game.player_bullets.add(bullet)
+    game.all_sprites.add(bullet)
+    return bullet
+
+
+def test_player_bullet_stops_at_the_first_enemy_along_its_path(game):
+    game.wave_transition = False
+    px, py = game.player.pos
+    nearer = game._spawn_enemy('tank', (px + 300, py))
+    further = game._spawn_enemy('tank', (px + 450, py))
+    aside = game._spawn_enemy('tank', (px + 320, py + 200))
+    hp = [enemy.hp for enemy in (nearer, further, aside)]
+
+    bullet = fire_through(game, (px + 150, py), (px + 560, py))
+    game._handle_collisions()
+
+    assert not bullet.alive()
+    assert [enemy.hp for enemy in (nearer, further, aside)] == [hp[0] - 1, hp[1], hp[2]]
+
+
+def test_player_bullet_hits_every_enemy_touched_at_its_first_contact(game):
+    game.wave_transition = False
+    px, py = game.player.pos
+    above = game._spawn_enemy('tank', (px + 300, py - 15))
+    below = game._spawn_enemy('tank', (px + 300, py + 15))
+    further = game._spawn_enemy('tank', (px + 450, py))
+    for enemy in (above, below):
+        enemy.radius = 30
+    hp = [enemy.hp for enemy in (above, below, further)]
+
+    bullet = fire_through(game, (px + 150, py), (px + 560, py))
+    game._handle_collisions()
+
+    assert not bullet.alive()
+    assert [enemy.hp for enemy in (above, below, further)] == [hp[0] - 1, hp[1] - 1, hp[2]]
+
+
+def test_enemy_bullet_hit_uses_each_bullets_radius(game):
+    game.wave_transition = False
+    px, py = game.player.pos
+    reach = game.player.radius + 20
+    small = bullet_pool.acquire(px + reach, py, 0.0, 0.0, 3, 'enemy')
+    # Outside the pool, so the bigger radius is not reused by later shots
+    large = Bullet(px, py + reach, 0.0, 0.0, 5, 'enemy')
+    large.radius = 25
+    game.enemy_bullets.add(small, large)
+    game.all_sprites.add(small, large)
+    hp = game.player.hp
+    game._handle_collisions()
+
+    assert small.alive() and not large.alive()
+    assert game.player.hp == hp - 5
@@ -0,0 +1,25 @@
+from bullet import bullet_pool
+from inputs import InputState
+
+
+def _play(game, steps):
+    game.wave_transition = False
+    for _ in range(steps):
+        game.step(1 / 60, InputState(shoot=True, aim_angle=0.0))
+
+
+def test_restart_returns_live_bullets_to_pool(game):
+    _play(game, 120)
+    live = len(game.player_bullets) + len(game.enemy_bullets)
+    assert live > 0
+    idle = len(bullet_pool.free)
+
+    game.start_new_game('normal')
+    assert len(bullet_pool.free) == idle + live
+    assert bullet_pool.get_stats()['created'] == 0
+    assert bullet_pool.reuse_rate == 0.0
+
+    # The new session draws on the bullets released by the old one
+    _play(game, 30)
+    assert bullet_pool.created == 0
+    assert bullet_pool.reuse_rate == 1.0
@@ -0,0 +1,37 @@
+def test_draw_keeps_group_order_and_culls_off_screen(game):
+    game.wave_transition = False
+    px, py = game.player.pos
+    near = game._spawn_enemy('tank', (px + 100, py))
+    far = game._spawn_enemy('tank', (px + 3000, py))
+    game.camera.follow(game.player, dt=10.0)
+    game.camera.interpolate(1.0)
+
+    drawn = []
+    for sprite in game.all_sprites:
+        sprite.draw = lambda *args, sprite=sprite: drawn.append(sprite)
+    game._draw_sprites()
+
+    # Player first, as when drawing the whole group
+    assert drawn == [game.player, near]
+    assert far not in drawn
+    assert game.render_stats['culled'] == 1
+
+
+def test_only_drawn_sprites_are_interpolated(game):
+    game.wave_transition = False
+    px, py = game.player.pos
+    near = game._spawn_enemy('tank', (px + 200, py))
+    far = game._spawn_enemy('tank', (px + 2000, py))
+    for _ in range(5):
+        game._store_previous_positions()
+        game.step(1 / 60)
+    far_rect = far.rect.copy()
+
+    game._interpolate(0.5)
+    game._draw_sprites()
+
+    store = game.enemy_store
+    prev, pos = store.prev_pos[near._slot], store.pos[near._slot]
+    assert tuple(prev) != tuple(pos)
+    assert near.rect.center == tuple(int(v) for v in (prev + pos) / 2)
+    assert far.rect == far_rect
@@ -0,0 +1,18 @@
+def test_enemy_positions_follow_the_store_when_read(game):
+    game.wave_transition = False
+    px, py = game.player.pos
+    enemies = [game._spawn_enemy(enemy_type, (px + 400, py + 60 * i))
+               for i, enemy_type in enumerate(('shooter', 'tank', 'bouncer'))]
+    for _ in range(10):
+        game.step(1 / 60)
+
+    store = game.enemy_store
+    for enemy in enemies:
+        assert tuple(enemy.pos) == tuple(store.pos[enemy._slot])
+    assert not store.stale[:store.count].any()
+
+    # A detached enemy keeps its last position
+    game.step(1 / 60)
+    last = tuple(store.pos[enemies[1]._slot])
+    enemies[1].kill()
+    assert tuple(enemies[1].pos) == last
@@ -0,0 +1,17 @@
+from config import MANA_MAX_DROPS
+
+
+def test_spread_out_drops_are_merged_down_to_the_cap(game):
+    game.wave_transition = False
+    game.wave_manager.enemies_remaining = 10 ** 9
+    game.player.pos.update(2300, 1500)
+
+    # Further apart than a merge cell, so no cell ever holds two drops
+    for i in range(MANA_MAX_DROPS + 100):
+        game._spawn_mana(100 + (i % 20) * 60, 100 + (i // 20) * 60)
+    total = sum(mana.amount for mana in game.mana_drops)
+    for _ in range(90):
+        game.step(1 / 60)
+
+    assert len(game.mana_drops) <= MANA_MAX_DROPS
+    assert sum(mana.amount for mana in game.mana_drops) + game.player.mana_earned == total
@@ -0,0 +1,79 @@
+from game import Game, GameState
+from inputs import InputState
+from replay import Replay
+
+
+def play(game, steps, first=0):
+    """Step with scripted inputs; returns a snapshot after every tick played"""
+    snapshots = []
+    for i in range(first, first + steps):
+        if game.state != GameState.PLAYING:
+            break
+        game.step(1 / 60, InputState(right=i % 90 < 45, shoot=True, aim_angle=i * 0.05,
+                                     dash=i % 40 == 0))
+        snapshots.append(snapshot(game))
+    return snapshots
+
+
+def snapshot(game):
+    return (game.state, tuple(game.player.pos), game.player.hp, game.player.mana,
+            game.wave_manager.current_wave,
+            sorted((enemy.enemy_type, tuple(enemy.pos), enemy.hp) for enemy in game.enemies))
+
+
+def replayed(replay, ticks=None):
+    """Snapshot after replaying the first ticks of a replay (default: all)"""
+    if ticks is not None:
+        replay = Replay(replay.seed, replay.difficulty, replay.sim_rate,
+                        replay.ticks[:ticks], replay.checkpoint)
+    game = Game(headless=True)
+    game.profiler.enabled = False
+    game.run_replay(replay, speed=0)
+    return snapshot(game)
+
+
+def assert_replays_live_run(path, live):
+    """The replay matches the live snapshots a quarter, half way and all the way in"""
+    replay = Replay.load(path)
+    assert len(replay) == len(live) > 0
+    for ticks in sorted({max(1, len(live) // 4), max(1, len(live) // 2), len(live)}):
+        assert replayed(replay, ticks) == live[ticks - 1]
+
+
+def test_each_session_is_recorded_to_its_own_file(new_game, tmp_path):
+    game = new_game(record_path=str(tmp_path / 'run.pve'))
+    sessions = []
+    for seed in (1, 2):
+        game.start_new_game('normal', seed=seed)
+        sessions.append(play(game, 900))
+    game._save_recording()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['run-1.pve', 'run-2.pve']
+    assert_replays_live_run(tmp_path / 'run-1.pve', sessions[0])
+    assert_replays_live_run(tmp_path / 'run-2.pve', sessions[1])
+
+
+def test_session_restored_from_a_save_state_replays_from_it(new_game, tmp_path):
+    game = new_game(record_path=str(tmp_path / 'run.pve'))
+    game.start_new_game('normal', seed=3)
+    before_load = play(game, 700)
+    game.quicksave(str(tmp_path / 'quick.state'))
+    before_load += play(game, 200, first=700)
+    assert game.quickload(str(tmp_path / 'quick.state'))
+    after_load = play(game, 300, first=45)
+    game._save_recording()
+
+    assert Replay.load(tmp_path / 'run-1.pve').checkpoint is None
+    assert Replay.load(tmp_path / 'run-2.pve').checkpoint is not None
+    assert_replays_live_run(tmp_path / 'run-1.pve', before_load)
+    assert_replays_live_run(tmp_path / 'run-2.pve', after_load)
+
+
+def test_seeds_above_the_signed_range_are_recorded(new_game, tmp_path):
+    game = new_game(seed=2 ** 64 - 1, record_path=str(tmp_path / 'run.pve'))
+    game.start_new_game('normal')
+    play(game, 30)
+    game._save_recording()
+
+    replay = Replay.load(tmp_path / 'run-1.pve')
+    assert (replay.seed, len(replay)) == (2 ** 64 - 1, 30)
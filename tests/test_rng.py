@@ -0,0 +1,22 @@
+import argparse
+
+import pytest
+
+from game import Game
+from main import seed_arg
+from rng import MAX_SEED, SessionRNG
+
+
+@pytest.mark.parametrize('seed', [-1, -2 ** 63, MAX_SEED + 1])
+def test_out_of_range_seeds_are_rejected(seed):
+    with pytest.raises(ValueError, match='Seed must be between'):
+        SessionRNG(seed)
+    with pytest.raises(ValueError, match='Seed must be between'):
+        Game(headless=True, seed=seed)
+    with pytest.raises(argparse.ArgumentTypeError):
+        seed_arg(str(seed))
+
+
+def test_largest_seed_is_accepted():
+    assert SessionRNG(MAX_SEED).seed == MAX_SEED
+    assert seed_arg(str(MAX_SEED)) == MAX_SEED
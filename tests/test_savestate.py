@@ -0,0 +1,7 @@
+def test_save_state_keeps_seeds_above_the_signed_range(new_game, tmp_path):
+    game = new_game(seed=2 ** 63 + 5)
+    game.start_new_game('normal')
+    game.quicksave(str(tmp_path / 'quick.state'))
+    game.start_new_game('normal', seed=1)
+    assert game.quickload(str(tmp_path / 'quick.state'))
+    assert game.rng.seed == 2 ** 63 + 5
@@ -0,0 +1,17 @@
+import csv
+
+
+def test_frames_are_numbered_per_session(new_game, tmp_path):
+    path = tmp_path / 'frames.csv'
+    game = new_game(telemetry_path=str(path))
+    for _ in range(2):
+        game.start_new_game('normal')
+        for _ in range(10):
+            game.step(1 / 60)
+    game.telemetry.close()
+
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [(row['session'], row['frame']) for row in rows] == (
+        [('1', str(i)) for i in range(10)] + [('2', str(i)) for i in range(10)]
+    )
@@ -0,0 +1,14 @@
+def test_prebuilt_enemies_spawn_away_from_where_the_player_ends_up(new_game):
+    game = new_game(seed=0)
+    game.start_new_game('normal')
+    while game.wave_timer > 0.5:
+        game.step(1 / 60)
+    assert game.prebuilt_enemies
+
+    # Move to the left border late in the transition, as a dash would
+    game.player.pos.update(100, 800)
+    while game.wave_transition:
+        game.step(1 / 60)
+
+    distances = [enemy.pos.distance_to(game.player.pos) for enemy in game.enemies]
+    assert distances and min(distances) >= 300
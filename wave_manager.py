@@ -4,15 +4,18 @@ Controls enemy spawning, wave progression, and difficulty scaling.
 """
 
 import random
+from collections import deque
 from config import (WORLD_WIDTH, WORLD_HEIGHT, WAVE_BASE_ENEMIES,
-                    WAVE_ENEMY_INCREMENT, DIFFICULTY_SETTINGS)
+                    WAVE_ENEMY_INCREMENT, DIFFICULTY_SETTINGS,
+                    WAVE_SPAWN_MODE, WAVE_TRICKLE_INTERVAL, WAVE_TRICKLE_BATCH)
 
 
 class WaveManager:
     """Manages wave progression and enemy spawning"""
 
-    def __init__(self, difficulty='normal'):
+    def __init__(self, difficulty='normal', rng=None, spawn_mode=WAVE_SPAWN_MODE):
         self.difficulty = difficulty
+        self.rng = rng if rng is not None else random  # Gameplay stream
         self.difficulty_settings = DIFFICULTY_SETTINGS[difficulty]
         self.current_wave = 0
         self.waves_to_win = self.difficulty_settings['waves_to_win']
@@ -22,6 +25,16 @@ class WaveManager:
         # Enemy type progression
         self.available_enemy_types = self._get_available_types()
 
+        # Enemy types waiting to be spawned ('budget' or 'trickle' mode)
+        self.spawn_queue = deque()
+        self.spawn_mode = spawn_mode
+        self.trickle_interval = WAVE_TRICKLE_INTERVAL
+        self.trickle_batch = WAVE_TRICKLE_BATCH
+        self.spawn_timer = 0
+
+        # Enemy types of the next wave picked ahead of start_wave() (None = not planned)
+        self.next_wave_types = None
+
     def _get_available_types(self):
         """Get enemy types available based on wave progression"""
         # Start with basic enemies, unlock more as waves progress
@@ -38,45 +51,88 @@ class WaveManager:
         self.wave_active = True
 
         # Calculate enemies for this wave
-        base_count = WAVE_BASE_ENEMIES + (self.current_wave - 1) * WAVE_ENEMY_INCREMENT
-        self.enemies_remaining = int(base_count * self.difficulty_settings['spawn_rate_multiplier'])
+        self.enemies_remaining = self._enemy_count(self.current_wave)
 
         return self._get_wave_info()
 
-    def get_enemy_spawn_list(self):
-        """Get list of enemy types to spawn for current wave"""
-        if not self.wave_active:
-            return []
+    def _enemy_count(self, wave):
+        base_count = WAVE_BASE_ENEMIES + (wave - 1) * WAVE_ENEMY_INCREMENT
+        return int(base_count * self.difficulty_settings['spawn_rate_multiplier'])
+
+    def get_enemy_spawn_list(self, wave=None):
+        """Get list of enemy types to spawn for a wave (default: the current one)"""
+        if wave is None:
+            if not self.wave_active:
+                return []
+            wave = self.current_wave
+            count = self.enemies_remaining
+        else:
+            count = self._enemy_count(wave)
 
-        # Get available enemy types for current wave
+        # Get available enemy types for the wave
         types = ['shooter']  # Default
         for wave_threshold, enemy_types in sorted(self.available_enemy_types.items()):
-            if self.current_wave >= wave_threshold:
+            if wave >= wave_threshold:
                 types = enemy_types
 
         # Create spawn list with weighted randomness
         spawn_list = []
-        for _ in range(self.enemies_remaining):
-            enemy_type = self._select_enemy_type(types)
+        for _ in range(count):
+            enemy_type = self._select_enemy_type(types, wave)
             spawn_list.append(enemy_type)
 
         return spawn_list
 
-    def _select_enemy_type(self, available_types):
+    def plan_next_wave(self):
+        """Pick the next wave's enemy types now so they can be built ahead of time"""
+        self.next_wave_types = deque(self.get_enemy_spawn_list(self.current_wave + 1))
+        return self.next_wave_types
+
+    def plan_spawns(self):
+        """
+        Queue the current wave's enemies to be spawned over the next frames
+        (only the planned types that were not built ahead of time)
+        """
+        if self.next_wave_types is not None:
+            self.spawn_queue.extend(self.next_wave_types)
+            self.next_wave_types = None
+        else:
+            self.spawn_queue.extend(self.get_enemy_spawn_list())
+        self.spawn_timer = 0
+
+    def spawn_allowance(self, dt):
+        """Number of queued enemies that may spawn this step"""
+        if not self.spawn_queue:
+            return 0
+        if self.spawn_mode != 'trickle':
+            return len(self.spawn_queue)
+
+        # Trickle: a small batch every interval
+        self.spawn_timer -= dt
+        count = 0
+        while self.spawn_timer <= 0:
+            count += self.trickle_batch
+            self.spawn_timer += self.trickle_interval
+        return min(count, len(self.spawn_queue))
+
+    def _select_enemy_type(self, available_types, wave=None):
         """Select enemy type with weighted randomness"""
+        if wave is None:
+            wave = self.current_wave
+
         # Weight distribution based on wave number
         weights = {
             'shooter': 10,
-            'bouncer': 5 + min(self.current_wave, 10),
-            'exploder': 3 + min(self.current_wave // 2, 8),
-            'tank': min(self.current_wave // 3, 5)
+            'bouncer': 5 + min(wave, 10),
+            'exploder': 3 + min(wave // 2, 8),
+            'tank': min(wave // 3, 5)
         }
 
         # Filter to available types
         type_weights = [(t, weights.get(t, 1)) for t in available_types]
         types, type_weights = zip(*type_weights)
 
-        return random.choices(types, weights=type_weights)[0]
+        return self.rng.choices(types, weights=type_weights)[0]
 
     def enemy_killed(self):
         """Called when an enemy is killed"""
@@ -86,7 +142,7 @@ class WaveManager:
 
     def is_wave_complete(self):
         """Check if current wave is complete"""
-        return not self.wave_active and self.enemies_remaining <= 0
+        return not self.wave_active and self.enemies_remaining <= 0 and not self.spawn_queue
 
     def is_game_won(self):
         """Check if player has won the game"""
@@ -105,22 +161,22 @@ class WaveManager:
         border_margin = 150  # Distance from edge to spawn
 
         # Choose which border to spawn on (0=top, 1=right, 2=bottom, 3=left)
-        border = random.randint(0, 3)
+        border = self.rng.randint(0, 3)
 
         max_attempts = 10
         for _ in range(max_attempts):
             if border == 0:  # Top
-                x = random.randint(border_margin, WORLD_WIDTH - border_margin)
-                y = random.randint(50, border_margin)
+                x = self.rng.randint(border_margin, WORLD_WIDTH - border_margin)
+                y = self.rng.randint(50, border_margin)
             elif border == 1:  # Right
-                x = random.randint(WORLD_WIDTH - border_margin, WORLD_WIDTH - 50)
-                y = random.randint(border_margin, WORLD_HEIGHT - border_margin)
+                x = self.rng.randint(WORLD_WIDTH - border_margin, WORLD_WIDTH - 50)
+                y = self.rng.randint(border_margin, WORLD_HEIGHT - border_margin)
             elif border == 2:  # Bottom
-                x = random.randint(border_margin, WORLD_WIDTH - border_margin)
-                y = random.randint(WORLD_HEIGHT - border_margin, WORLD_HEIGHT - 50)
+                x = self.rng.randint(border_margin, WORLD_WIDTH - border_margin)
+                y = self.rng.randint(WORLD_HEIGHT - border_margin, WORLD_HEIGHT - 50)
             else:  # Left
-                x = random.randint(50, border_margin)
-                y = random.randint(border_margin, WORLD_HEIGHT - border_margin)
+                x = self.rng.randint(50, border_margin)
+                y = self.rng.randint(border_margin, WORLD_HEIGHT - border_margin)
 
             distance = ((x - player_pos.x) ** 2 + (y - player_pos.y) ** 2) ** 0.5
             if distance >= min_distance:
@@ -131,13 +187,13 @@ class WaveManager:
 
         # Fallback: random border position
         if border == 0:
-            return (random.randint(border_margin, WORLD_WIDTH - border_margin), 80)
+            return (self.rng.randint(border_margin, WORLD_WIDTH - border_margin), 80)
         elif border == 1:
-            return (WORLD_WIDTH - 80, random.randint(border_margin, WORLD_HEIGHT - border_margin))
+            return (WORLD_WIDTH - 80, self.rng.randint(border_margin, WORLD_HEIGHT - border_margin))
         elif border == 2:
-            return (random.randint(border_margin, WORLD_WIDTH - border_margin), WORLD_HEIGHT - 80)
+            return (self.rng.randint(border_margin, WORLD_WIDTH - border_margin), WORLD_HEIGHT - 80)
         else:
-            return (80, random.randint(border_margin, WORLD_HEIGHT - border_margin))
+            return (80, self.rng.randint(border_margin, WORLD_HEIGHT - border_margin))
 
     def get_difficulty_multipliers(self):
         """Get difficulty multipliers for enemy creation"""